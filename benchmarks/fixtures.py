@@ -0,0 +1,147 @@
+import json
+
+import numpy as np
+
+from gesture_engine.gestures import GESTURE_IDS, UNKNOWN
+from gesture_engine.landmarks import INDEX_TIP, THUMB_BASE, THUMB_TIP
+from gesture_engine.replay import RECORDING_FORMAT, RECORDING_VERSION
+from gesture_engine.workflows import CompiledWorkflow
+
+# Resting pose of a right hand seen by the mirrored camera, in normalized image coordinates
+WRIST = (0.50, 0.80)
+FINGER_X = (0.42, 0.48, 0.54, 0.60)  # Index, Middle, Ring, Pinky
+FINGER_BASE_Y = 0.62
+PIP_Y = 0.50
+TIP_UP_Y = 0.35
+TIP_DOWN_Y = 0.58
+
+# Small per-landmark noise, well below every classification threshold
+JITTER = 0.004
+
+
+def synthetic_hand(mask, touch=False, rng=None, jitter=JITTER):
+    """
+    Build a (21, 3) float32 hand whose fingers match a 5-bit finger mask (thumb is bit 0).
+
+    With touch the thumb and index tips are brought together, as the
+    thumb_index_touch check expects.
+    """
+    points = np.zeros((21, 3), dtype=np.float32)
+    points[0, :2] = WRIST
+
+    # Thumb: CMC, MCP, IP and tip run sideways from the base when extended
+    thumb_reach = 0.16 if mask & 1 else 0.03
+    for joint in range(1, 5):
+        points[joint, :2] = (WRIST[0] - 0.04 - 0.01 * joint, 0.74 - 0.03 * joint)
+    points[THUMB_TIP, 0] = points[THUMB_BASE, 0] - thumb_reach
+
+    # Fingers: MCP, PIP, DIP and tip, the tip above the PIP joint when raised
+    for finger, x in enumerate(FINGER_X):
+        tip = 8 + 4 * finger
+        tip_y = TIP_UP_Y if mask >> (finger + 1) & 1 else TIP_DOWN_Y
+        points[tip - 3, :2] = (x, FINGER_BASE_Y)
+        points[tip - 2, :2] = (x, PIP_Y)
+        points[tip - 1, :2] = (x, (PIP_Y + tip_y) / 2)
+        points[tip, :2] = (x, tip_y)
+
+    if touch:
+        points[INDEX_TIP, :2] = points[THUMB_TIP, :2] + (0.01, 0.01)
+
+    if rng is not None and jitter:
+        points[:, :2] += rng.uniform(-jitter, jitter, size=(21, 2)).astype(np.float32)
+    return points
+
+
+def gesture_pose(layout, gesture):
+    """
+    Return (mask, touch) of a finger pose the layout labels with gesture.
+    """
+    gesture = GESTURE_IDS[gesture]
+    for mask in range(len(layout.gesture_table)):
+        if layout.gesture_table[mask] == gesture:
+            return mask, layout.check_table[mask] == "thumb_index_touch"
+    raise ValueError(f"Layout {layout.name!r} has no pose for {gesture!r}")
+
+
+def workflow_gestures(workflows):
+    """
+    Return the distinct gestures used by a list of workflows, in order of first use.
+    """
+    return list(dict.fromkeys(gesture for workflow in workflows for gesture in workflow))
+
+
+def synthetic_workflows(gestures, count, length=14, seed=0):
+    """
+    Build count random workflow definitions over gestures, with some optional, repeated and alternative steps.
+
+    The last step is always a plain gesture, and definitions that could still
+    continue once complete (which CompiledWorkflow rejects) are drawn again.
+    """
+    rng = np.random.default_rng(seed)
+    workflows = []
+    while len(workflows) < count:
+        steps = []
+        for _ in range(length - 1):
+            step = str(rng.choice(gestures))
+            kind = rng.random()
+            if kind < 0.1:
+                step += "?"
+            elif kind < 0.2:
+                step += "{2}"
+            elif kind < 0.3:
+                step += "|" + str(rng.choice(gestures))
+            steps.append(step)
+        steps.append(str(rng.choice(gestures)))
+        try:
+            CompiledWorkflow(steps)
+        except ValueError:
+            continue
+        workflows.append(steps)
+    return workflows
+
+
+def synthetic_landmarks(layout, gestures, count, seed=0):
+    """
+    Build count jittered hands cycling through gestures, plus some hands the layout rejects.
+
+    Returns (landmarks, expected) where landmarks is an (N, 21, 3) float32
+    array and expected holds the gesture id each row should classify as.
+    """
+    rng = np.random.default_rng(seed)
+    poses = [(gesture_pose(layout, gesture), GESTURE_IDS[gesture]) for gesture in gestures]
+    # Unclaimed masks exercise the UNKNOWN path
+    poses += [((mask, False), UNKNOWN) for mask in range(len(layout.gesture_table))
+              if layout.gesture_table[mask] == UNKNOWN][:2]
+
+    landmarks = np.empty((count, 21, 3), dtype=np.float32)
+    expected = np.empty(count, dtype=np.int8)
+    for row in range(count):
+        (mask, touch), gesture = poses[row % len(poses)]
+        landmarks[row] = synthetic_hand(mask, touch, rng)
+        expected[row] = gesture
+    return landmarks, expected
+
+
+def write_recording(path, layout, workflows, hold_frames=12, gap_frames=10, fps=30.0, seed=0):
+    """
+    Write a landmark recording performing every workflow step in turn.
+
+    Each gesture is held for hold_frames frames and followed by gap_frames
+    frames without a hand, longer than the default voting window, so the
+    debouncer fires every step exactly once, repeated steps included.
+    Returns the number of frames written.
+    """
+    rng = np.random.default_rng(seed)
+    frames = 0
+    with open(path, mode="w") as file:
+        file.write(json.dumps({"format": RECORDING_FORMAT, "version": RECORDING_VERSION}) + "\n")
+        for workflow in workflows:
+            for gesture in workflow:
+                mask, touch = gesture_pose(layout, gesture)
+                for i in range(hold_frames + gap_frames):
+                    hands = []
+                    if i < hold_frames:
+                        hands = [np.round(synthetic_hand(mask, touch, rng), 5).tolist()]
+                    file.write(json.dumps({"t": round(frames / fps, 4), "hands": hands}) + "\n")
+                    frames += 1
+    return frames
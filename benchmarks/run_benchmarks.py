@@ -0,0 +1,495 @@
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+# Make the shared gesture_engine package importable when run as a script
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+RESULTS_DIR = "logs/benchmarks"
+
+# Metrics compared by --compare, as (path in the results, True when higher is better)
+REGRESSION_METRICS = [
+    ("classification.specific.scalar.hands_per_second", True),
+    ("classification.specific.batch.hands_per_second", True),
+    ("classification.counting.scalar.hands_per_second", True),
+    ("classification.counting.batch.hands_per_second", True),
+    ("pipeline.replay_specific.fps", True),
+    ("pipeline.replay_counting.fps", True),
+    ("pipeline.workflows_specific.fps", True),
+    ("pipeline.workflows_counting.fps", True),
+    ("pipeline.video.fps", True),
+    ("workflow_matching.3.gestures_per_second", True),
+    ("workflow_matching.1003.gestures_per_second", True),
+    ("preprocess.buffers.us_per_frame", False),
+    ("preprocess.mirror.us_per_frame", False),
+    ("startup.total_seconds", False),
+    ("memory.peak_rss_mb", False),
+]
+
+
+def startup_probe(model_complexity):
+    """
+    Time a cold start in this process and print it as JSON; run by measure_startup in a fresh interpreter.
+    """
+    start = time.perf_counter()
+    import numpy as np
+    import mediapipe as mp
+    from workflows import demo_workflow_specific, demo_workflows_counting
+    imported = time.perf_counter()
+
+    hands = mp.solutions.hands.Hands(model_complexity=model_complexity, max_num_hands=1)
+    built = time.perf_counter()
+
+    hands.process(np.zeros((480, 640, 3), dtype=np.uint8))
+    first_frame = time.perf_counter()
+    hands.close()
+
+    print(json.dumps({
+        "import_seconds": imported - start,
+        "hands_seconds": built - imported,
+        "first_frame_seconds": first_frame - built,
+        "total_seconds": first_frame - start,
+    }))
+
+
+def measure_startup(runs, model_complexity):
+    """
+    Run startup_probe in fresh interpreters and keep the fastest and mean times.
+    """
+    samples = []
+    for _ in range(runs):
+        output = subprocess.run([sys.executable, os.path.abspath(__file__), "--startup-probe",
+                                 "--model-complexity", str(model_complexity)],
+                                capture_output=True, text=True, check=True).stdout
+        samples.append(json.loads(output.strip().splitlines()[-1]))
+
+    result = {"runs": runs}
+    for key in samples[0]:
+        values = [sample[key] for sample in samples]
+        result[key] = round(min(values), 4)
+        result[f"mean_{key}"] = round(sum(values) / len(values), 4)
+    return result
+
+
+def best_time(function, repeat):
+    """
+    Return the fastest of repeat calls to function, in seconds.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def traced_peak(function):
+    """
+    Run function once and return the peak Python heap it allocated, in megabytes.
+    """
+    tracemalloc.start()
+    try:
+        function()
+        return round(tracemalloc.get_traced_memory()[1] / 2 ** 20, 3)
+    finally:
+        tracemalloc.stop()
+
+
+def peak_rss_mb():
+    """
+    Peak resident memory of this process in megabytes, or None when unavailable.
+    """
+    try:
+        import resource
+    except ImportError:
+        import psutil
+        # Windows reports the peak working set
+        return round(getattr(psutil.Process().memory_info(), "peak_wset", 0) / 2 ** 20, 1) or None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return round(peak / (2 ** 20 if sys.platform == "darwin" else 2 ** 10), 1)
+
+
+def benchmark_classifier(detect_gesture, classifier, landmarks, expected, repeat):
+    """
+    Measure the single-hand detect_gesture path and the batch path on the same hands.
+    """
+    from gesture_engine.gestures import GESTURES
+    from gesture_engine.replay import list_to_hand
+
+    hands = [list_to_hand(hand.tolist()) for hand in landmarks]
+    count = len(hands)
+
+    scalar_seconds = best_time(lambda: [detect_gesture(hand) for hand in hands], repeat)
+    batch_seconds = best_time(lambda: classifier.classify_batch(landmarks), repeat)
+
+    result = {
+        "hands": count,
+        "gestures": sorted({GESTURES[gesture] for gesture in expected}) if expected is not None else None,
+        "scalar": {
+            "seconds": round(scalar_seconds, 6),
+            "hands_per_second": round(count / scalar_seconds),
+            "us_per_hand": round(scalar_seconds / count * 1e6, 3),
+            "peak_heap_mb": traced_peak(lambda: [detect_gesture(hand) for hand in hands]),
+        },
+        "batch": {
+            "seconds": round(batch_seconds, 6),
+            "hands_per_second": round(count / batch_seconds),
+            "us_per_hand": round(batch_seconds / count * 1e6, 3),
+            "peak_heap_mb": traced_peak(lambda: classifier.classify_batch(landmarks)),
+        },
+    }
+    if expected is not None:
+        scalar_ids = [GESTURES.index(detect_gesture(hand)) for hand in hands]
+        result["scalar"]["accuracy"] = round(float((scalar_ids == expected).mean()), 4)
+        result["batch"]["accuracy"] = round(float((classifier.classify_batch(landmarks) == expected).mean()), 4)
+    return result
+
+
+def benchmark_preprocess(frame_count, repeat):
+    """
+    Time mirroring plus color conversion of camera-sized frames in every preprocessing mode.
+
+    Allocations are the full-size images allocated per frame; the heap peak
+    comes from tracemalloc, which sees numpy buffers, after one warm-up frame.
+    """
+    import numpy as np
+    from gesture_engine.preprocess import PREPROCESS_MODES, FramePreprocessor
+
+    frames = [np.random.default_rng(i).integers(0, 256, (480, 640, 3), dtype=np.uint8) for i in range(8)]
+    result = {}
+    for mode in PREPROCESS_MODES:
+        preprocessor = FramePreprocessor(mode)
+        # Warm up so buffer modes have their buffers, then count from zero
+        preprocessor.to_rgb(preprocessor.mirror(frames[0]))
+        preprocessor.frames = preprocessor.allocations = 0
+
+        def run():
+            for i in range(frame_count):
+                preprocessor.to_rgb(preprocessor.mirror(frames[i % len(frames)]))
+
+        seconds = best_time(run, repeat)
+        result[mode] = {
+            "us_per_frame": round(seconds / frame_count * 1e6, 2),
+            "allocations_per_frame": preprocessor.stats()["allocations_per_frame"],
+            "peak_heap_mb": traced_peak(run),
+        }
+    return result
+
+
+def run_pipeline(cap, hands, classifier, profiler):
+    """
+    Push every frame of cap through flip, color conversion, the hand model, the classifier and the debouncer.
+
+    Mirrors the live control loop without drawing or executing actions.
+    Returns frames processed, wall time and the gestures that fired.
+    """
+    import cv2
+    from gesture_engine.debounce import GestureDebouncer
+
+    debouncer = GestureDebouncer(per_action=classifier.required_frames)
+    fired = []
+    frames = 0
+    start_time = time.perf_counter()
+    while True:
+        start = profiler.now()
+        success, frame = cap.read()
+        profiler.record("cap.read", start)
+        if not success:
+            break
+        frames += 1
+
+        start = profiler.now()
+        frame = cv2.flip(frame, 1)
+        profiler.record("cv2.flip", start)
+
+        start = profiler.now()
+        frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        profiler.record("cv2.cvtColor", start)
+
+        start = profiler.now()
+        results = hands.process(frame_rgb)
+        profiler.record("hands.process", start)
+
+        start = profiler.now()
+        gesture = "UNKNOWN"
+        for hand_landmarks in results.multi_hand_landmarks or ():
+            gesture = classifier.classify(hand_landmarks)
+        profiler.record("classify", start)
+
+        gesture = debouncer.update(gesture)
+        if gesture is not None:
+            fired.append(gesture)
+    return frames, time.perf_counter() - start_time, fired
+
+
+def pipeline_result(frames, seconds, fired, profiler, expected=None):
+    result = {
+        "frames": frames,
+        "seconds": round(seconds, 4),
+        "fps": round(frames / seconds, 1) if seconds else 0.0,
+        "fired": len(fired),
+        "stages": profiler.summary(),
+    }
+    if expected is not None:
+        result["expected"] = len(expected)
+        result["matches_workflows"] = fired == expected
+    return result
+
+
+def benchmark_replay(path, classifier, expected=None):
+    """
+    Frames per second of the pipeline over a landmark recording, without the hand model.
+    """
+    from gesture_engine.profiling import StageProfiler
+    from gesture_engine.replay import ReplayCapture, ReplayHands, ReplaySource
+
+    source = ReplaySource(path)
+    profiler = StageProfiler()
+    frames, seconds, fired = run_pipeline(ReplayCapture(source), ReplayHands(source), classifier, profiler)
+    return pipeline_result(frames, seconds, fired, profiler, expected)
+
+
+def benchmark_workflows(path, module):
+    """
+    Frames per second of process_workflow itself over a recording, performing actions on a simulated presentation.
+    """
+    from gesture_engine.backends import SimulatedPresentation
+    from gesture_engine.session import GestureSession
+
+    backend = SimulatedPresentation()
+    session = GestureSession(replay_path=path, headless=True, dispatch_actions=False, backend=backend)
+    session.open()
+    errors = []
+    start_time = time.perf_counter()
+    for flow_number, workflow in enumerate(module.WORKFLOWS, start=1):
+        backend.open_deck(f"WORKFLOW_{flow_number}.pptx")
+        module.process_workflow(workflow, flow_number, session, lambda *error: errors.append(error))
+        backend.close_deck()
+    seconds = time.perf_counter() - start_time
+    frames = session.preprocessor.frames
+    session.close()
+    return {
+        "frames": frames,
+        "seconds": round(seconds, 4),
+        "fps": round(frames / seconds, 1) if seconds else 0.0,
+        "errors": len(errors),
+        "matches_workflows": backend.performed() == [gesture for workflow in module.WORKFLOWS for gesture in workflow],
+        "final_state": backend.state(),
+    }
+
+
+def benchmark_workflow_matching(workflows, extra_counts, repeat):
+    """
+    Gestures per second of matching one gesture stream against growing numbers of workflows at once.
+
+    The stream performs every workflow in turn. The cold pass builds the
+    product automaton's states; later passes only look transitions up.
+    """
+    from benchmarks.fixtures import synthetic_workflows, workflow_gestures
+    from gesture_engine.gestures import GESTURE_IDS
+    from gesture_engine.workflows import WorkflowSet
+
+    stream = [GESTURE_IDS[gesture] for workflow in workflows for gesture in workflow] * 20
+    result = {}
+    for extra in extra_counts:
+        workflow_set = WorkflowSet(list(workflows) + synthetic_workflows(workflow_gestures(workflows), extra),
+                                   strict=False)
+
+        def run():
+            workflow_set.reset()
+            for gesture_id in stream:
+                workflow_set.feed(gesture_id)
+
+        start = time.perf_counter()
+        run()
+        cold_seconds = time.perf_counter() - start
+        seconds = best_time(run, repeat)
+        result[str(len(workflow_set.workflows))] = {
+            "gestures": len(stream),
+            "cold_gestures_per_second": round(len(stream) / cold_seconds),
+            "gestures_per_second": round(len(stream) / seconds),
+            "product_states": workflow_set.stats()["product_states"],
+        }
+    return result
+
+
+def benchmark_video(path, classifier, model_complexity):
+    """
+    Frames per second of the full pipeline, hand model included, over a video file.
+    """
+    import cv2
+    import mediapipe as mp
+    from gesture_engine.profiling import StageProfiler
+
+    cap = cv2.VideoCapture(path)
+    if not cap.isOpened():
+        raise SystemExit(f"Cannot open video {path}")
+    hands = mp.solutions.hands.Hands(model_complexity=model_complexity, max_num_hands=1)
+    profiler = StageProfiler()
+    try:
+        frames, seconds, fired = run_pipeline(cap, hands, classifier, profiler)
+    finally:
+        hands.close()
+        cap.release()
+    result = pipeline_result(frames, seconds, fired, profiler)
+    result["model_complexity"] = model_complexity
+    return result
+
+
+def environment():
+    """
+    Describe the machine and library versions the results were measured with.
+    """
+    import cv2
+    import mediapipe as mp
+    import numpy as np
+
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                                cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip() or None
+    except OSError:
+        commit = None
+    return {
+        "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "commit": commit,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "processor": platform.processor() or platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "numpy": np.__version__,
+        "opencv": cv2.__version__,
+        "mediapipe": mp.__version__,
+    }
+
+
+def lookup(results, path):
+    for key in path.split("."):
+        if not isinstance(results, dict) or key not in results:
+            return None
+        results = results[key]
+    return results
+
+
+def compare(results, baseline, tolerance):
+    """
+    Print how each regression metric moved against a baseline run. Returns the regressed metrics.
+    """
+    regressions = []
+    print(f"Compared with {baseline['environment'].get('commit')} ({baseline['environment']['timestamp']}):")
+    for path, higher_is_better in REGRESSION_METRICS:
+        old, new = lookup(baseline, path), lookup(results, path)
+        if not old or new is None:
+            continue
+        change = (new - old) / old
+        worse = -change if higher_is_better else change
+        flag = "  REGRESSION" if worse > tolerance else ""
+        print(f"  {path:<52}{old:>12}{new:>12}{change:>+9.1%}{flag}")
+        if flag:
+            regressions.append(path)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the gesture classifiers and the frame pipeline.")
+    parser.add_argument("--output", metavar="PATH",
+                        help=f"where to write the JSON results (default: a timestamped file in {RESULTS_DIR})")
+    parser.add_argument("--hands", type=int, default=20000, help="synthetic hands per classifier")
+    parser.add_argument("--repeat", type=int, default=5, help="timing repeats, the fastest one is kept")
+    parser.add_argument("--recording", metavar="PATH", help="also benchmark a landmark recording made with --record")
+    parser.add_argument("--video", metavar="PATH", help="benchmark the full pipeline, hand model included, on a video")
+    parser.add_argument("--model-complexity", type=int, default=1, choices=(0, 1))
+    parser.add_argument("--startup-runs", type=int, default=3, help="cold starts to time, 0 to skip")
+    parser.add_argument("--compare", metavar="BASELINE", help="compare with an earlier results file")
+    parser.add_argument("--tolerance", type=float, default=0.1,
+                        help="relative slowdown reported as a regression by --compare")
+    parser.add_argument("--startup-probe", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.startup_probe:
+        startup_probe(args.model_complexity)
+        return
+
+    from benchmarks.fixtures import synthetic_landmarks, workflow_gestures, write_recording
+    from gesture_engine.replay import load_recording
+    from workflows import demo_workflow_specific, demo_workflows_counting
+
+    variants = {
+        "specific": demo_workflow_specific,
+        "counting": demo_workflows_counting,
+    }
+    results = {"environment": environment(), "classification": {}, "pipeline": {}}
+
+    with tempfile.TemporaryDirectory() as fixture_dir:
+        for name, module in variants.items():
+            layout = module.CLASSIFIER.layout
+            landmarks, expected = synthetic_landmarks(layout, workflow_gestures(module.WORKFLOWS), args.hands)
+            print(f"Classifying {len(landmarks)} synthetic hands with {name}...")
+            results["classification"][name] = benchmark_classifier(module.detect_gesture, module.CLASSIFIER,
+                                                                   landmarks, expected, args.repeat)
+
+            recording = os.path.join(fixture_dir, f"{name}.jsonl")
+            write_recording(recording, layout, module.WORKFLOWS)
+            expected_steps = [gesture for workflow in module.WORKFLOWS for gesture in workflow]
+            print(f"Replaying the {name} workflows through the pipeline...")
+            results["pipeline"][f"replay_{name}"] = benchmark_replay(recording, module.CLASSIFIER, expected_steps)
+            print(f"Running the {name} workflows against a simulated presentation...")
+            results["pipeline"][f"workflows_{name}"] = benchmark_workflows(recording, module)
+
+    print("Matching a gesture stream against many workflows at once...")
+    results["workflow_matching"] = benchmark_workflow_matching(demo_workflow_specific.WORKFLOWS, (0, 100, 1000),
+                                                               args.repeat)
+
+    print("Timing frame preprocessing...")
+    results["preprocess"] = benchmark_preprocess(300, args.repeat)
+
+    if args.recording:
+        _, landmarks, _ = load_recording(args.recording)
+        if len(landmarks):
+            print(f"Classifying {len(landmarks)} recorded hands...")
+            results["classification"]["recorded"] = {
+                name: benchmark_classifier(module.detect_gesture, module.CLASSIFIER, landmarks, None, args.repeat)
+                for name, module in variants.items()
+            }
+        results["pipeline"]["recorded"] = benchmark_replay(args.recording, demo_workflow_specific.CLASSIFIER)
+
+    if args.video:
+        print(f"Running the hand model over {args.video}...")
+        results["pipeline"]["video"] = benchmark_video(args.video, demo_workflow_specific.CLASSIFIER,
+                                                       args.model_complexity)
+
+    if args.startup_runs:
+        print(f"Timing {args.startup_runs} cold starts...")
+        results["startup"] = measure_startup(args.startup_runs, args.model_complexity)
+
+    results["memory"] = {"peak_rss_mb": peak_rss_mb()}
+
+    output = args.output or os.path.join(RESULTS_DIR, f"benchmark-{time.strftime('%Y%m%d-%H%M%S')}.json")
+    if os.path.dirname(output):
+        os.makedirs(os.path.dirname(output), exist_ok=True)
+    with open(output, mode="w") as file:
+        json.dump(results, file, indent=2)
+    print(f"Results written to {output}")
+
+    for name, result in results["classification"].items():
+        if "scalar" in result:
+            print(f"  {name:<10} scalar {result['scalar']['hands_per_second']:>10} hands/s"
+                  f"  batch {result['batch']['hands_per_second']:>12} hands/s")
+    for name, result in results["pipeline"].items():
+        print(f"  {name:<18} {result['fps']:>10} fps")
+
+    if args.compare:
+        with open(args.compare) as file:
+            baseline = json.load(file)
+        if compare(results, baseline, args.tolerance):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
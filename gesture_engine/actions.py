@@ -0,0 +1,43 @@
+# Console message and PowerPoint key for every gesture that triggers an action
+ACTIONS = {
+    "PRESENTATION_MODE_ON": ("Presentation Mode On", "f5"),
+    "PRESENTATION_MODE_OFF": ("Presentation Mode Off", "esc"),
+    "ENTER_PRESENTATION": ("Entering Presentation Mode", "f5"),
+    "EXIT_PRESENTATION": ("Exiting Presentation Mode", "esc"),
+    "QUESTION_BLOCK": ("Question Block (Blank Screen)", "b"),
+    "BLANK_SCREEN": ("Blank Screen", "b"),
+    "PLAY_VIDEO": ("Play Video", "space"),
+    "STOP_VIDEO": ("Stop Video", "space"),
+    "NEXT_SLIDE": ("Next Slide", "right"),
+    "PREVIOUS_SLIDE": ("Previous Slide", "left"),
+    # Only reached through gesture combos
+    "FIRST_SLIDE": ("First Slide", "home"),
+    "LAST_SLIDE": ("Last Slide", "end"),
+}
+
+
+def execute_action(action):
+    """
+    Execute an action based on the detected gesture.
+    """
+    execute_actions([action])
+
+
+def execute_actions(actions):
+    """
+    Execute several actions in order with a single key injection call.
+
+    pyautogui sleeps for its PAUSE after every call, so pressing the keys of
+    a whole batch at once pays that pause only once. It is imported here so
+    other backends work on machines without a display.
+    """
+    import pyautogui
+
+    keys = []
+    for action in actions:
+        if action in ACTIONS:
+            message, key = ACTIONS[action]
+            print(message)
+            keys.append(key)
+    if keys:
+        pyautogui.press(keys)
@@ -0,0 +1,159 @@
+import hashlib
+import json
+import os
+import platform
+import time
+
+import cv2
+import mediapipe as mp
+
+from gesture_engine.profiling import LatencyHistogram
+
+PROFILE_FILE = "logs/model_profiles.json"
+
+# Hand model settings from most accurate to cheapest; tracking confidence
+# below 0.5 re-runs palm detection less often while a hand is in view
+CANDIDATES = (
+    {"model_complexity": 1, "min_detection_confidence": 0.5, "min_tracking_confidence": 0.5},
+    {"model_complexity": 0, "min_detection_confidence": 0.5, "min_tracking_confidence": 0.5},
+    {"model_complexity": 0, "min_detection_confidence": 0.5, "min_tracking_confidence": 0.3},
+)
+
+SAMPLE_FRAMES = 10
+# Seconds to wait for a hand in view before giving up on measuring
+HAND_TIMEOUT = 20.0
+WARMUP_FRAMES = 5
+MEASURED_FRAMES = 40
+
+
+def machine_key():
+    """
+    Identify this machine and MediaPipe build, which together decide how fast the model runs.
+    """
+    description = "|".join([platform.node(), platform.machine(), platform.processor(),
+                            str(os.cpu_count()), mp.__version__])
+    return hashlib.sha1(description.encode("utf-8")).hexdigest()[:16]
+
+
+def sample_frames(cap, count=SAMPLE_FRAMES, timeout=HAND_TIMEOUT):
+    """
+    Grab RGB frames that show a hand to measure on. Returns [] if none is seen within timeout seconds.
+
+    The model only runs its landmark stage, and tracking only pays off, with
+    a hand in view, so hand-free frames would measure a much faster model
+    than the one a presenter gets.
+    """
+    print(f"Auto-tune: hold a hand in front of the camera for a few seconds ({timeout:.0f} second timeout)...")
+    frames = []
+    deadline = time.perf_counter() + timeout
+    with mp.solutions.hands.Hands(static_image_mode=True, max_num_hands=1, model_complexity=0) as detector:
+        while len(frames) < count and time.perf_counter() < deadline:
+            success, frame, _ = cap.read_with_timestamp()
+            if not success:
+                if not cap.isOpened():
+                    break
+                continue
+            frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+            if detector.process(frame_rgb).multi_hand_landmarks:
+                frames.append(frame_rgb)
+    return frames
+
+
+def measure(options, frames, max_num_hands=1):
+    """
+    Run one hand model setting over the sample frames. Returns fps and latency percentiles.
+    """
+    histogram = LatencyHistogram()
+    with mp.solutions.hands.Hands(max_num_hands=max_num_hands, **options) as hands:
+        for i in range(WARMUP_FRAMES):
+            hands.process(frames[i % len(frames)])
+        for i in range(MEASURED_FRAMES):
+            start = time.perf_counter()
+            hands.process(frames[i % len(frames)])
+            histogram.record(time.perf_counter() - start)
+    summary = histogram.summary()
+    return {
+        "options": options,
+        "fps": round(1000 / summary["mean_ms"], 1) if summary["mean_ms"] else 0.0,
+        "p50_ms": summary["p50_ms"],
+        "p95_ms": summary["p95_ms"],
+    }
+
+
+def choose(measurements, target_fps):
+    """
+    Pick the most accurate setting whose frame rate meets target_fps, or the fastest one.
+
+    Falling back down the candidate list only as far as needed keeps the
+    cheapest accuracy loss that still reaches the target.
+    """
+    for measurement in measurements:
+        if measurement["fps"] >= target_fps:
+            return measurement
+    return max(measurements, key=lambda measurement: measurement["fps"])
+
+
+class ModelProfileCache:
+    """
+    Hand model measurements per machine, stored as JSON so later runs skip the tuning phase.
+    """
+
+    def __init__(self, path=PROFILE_FILE):
+        self.path = path
+
+    def load(self):
+        if not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path) as file:
+                return json.load(file)
+        except ValueError:
+            print(f"Ignoring unreadable model profile cache {self.path}")
+            return {}
+
+    def get(self, key):
+        return self.load().get(key)
+
+    def put(self, key, profile):
+        profiles = self.load()
+        profiles[key] = profile
+        # Write a temporary file first so an interrupted run never leaves a torn cache
+        temporary = f"{self.path}.tmp"
+        with open(temporary, mode="w") as file:
+            json.dump(profiles, file, indent=2)
+        os.replace(temporary, self.path)
+
+
+def tune_hands_options(cap, target_fps, max_num_hands=1, cache=None, retune=False):
+    """
+    Return Hands options meeting target_fps on this machine, measuring only on the first run.
+
+    Measurements are cached per machine; the choice is made again from them
+    every time, so changing the target needs no new measurement. When no
+    hand shows up to measure on, nothing is cached and {} (the session's
+    own settings) is returned.
+    """
+    cache = cache or ModelProfileCache()
+    key = machine_key()
+    profile = None if retune else cache.get(key)
+
+    if profile is None:
+        start = time.perf_counter()
+        frames = sample_frames(cap)
+        if not frames:
+            print("Auto-tune: no hand seen, keeping the default hand model settings.")
+            return {}
+        measurements = [measure(options, frames, max_num_hands) for options in CANDIDATES]
+        profile = {
+            "machine": f"{platform.node()} ({platform.processor() or platform.machine()}, {os.cpu_count()} CPUs)",
+            "mediapipe": mp.__version__,
+            "measured_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "measurements": measurements,
+        }
+        cache.put(key, profile)
+        print(f"Measured hand model settings in {time.perf_counter() - start:.2f} seconds.")
+
+    chosen = choose(profile["measurements"], target_fps)
+    print(f"Hand model: {chosen['options']} ({chosen['fps']:.1f} fps, p95 {chosen['p95_ms']:.1f} ms, "
+          f"target {target_fps:.0f} fps)")
+    return dict(chosen["options"])
@@ -0,0 +1,201 @@
+import time
+
+from gesture_engine.actions import ACTIONS, execute_actions
+from gesture_engine.launcher import PresentationLauncher
+
+
+class ActionBackend:
+    """
+    Where recognized gestures end up: performs actions and opens and closes decks.
+
+    perform() takes a batch of action names, as ActionDispatcher delivers
+    them. Deck handling is optional; preload_deck() may start opening a deck
+    early so open_deck() only has to wait for it.
+    """
+
+    name = "base"
+
+    def __init__(self):
+        self.launches = []
+
+    def perform(self, actions):
+        raise NotImplementedError
+
+    def preload_deck(self, pptx_path):
+        pass
+
+    def open_deck(self, pptx_path):
+        pass
+
+    def close_deck(self):
+        pass
+
+    def stats(self):
+        return {}
+
+
+class KeyboardBackend(ActionBackend):
+    """
+    Press PowerPoint's keys with pyautogui and drive the real PowerPoint application.
+    """
+
+    name = "keyboard"
+
+    def __init__(self, launcher=None):
+        super().__init__()
+        self.launcher = launcher or PresentationLauncher()
+        self.launches = self.launcher.launches
+
+    def perform(self, actions):
+        execute_actions(actions)
+
+    def preload_deck(self, pptx_path):
+        self.launcher.open(pptx_path)
+
+    def open_deck(self, pptx_path):
+        return self.launcher.launch(pptx_path)
+
+    def close_deck(self):
+        """
+        Close the PowerPoint application by terminating its process.
+        """
+        import win32com.client
+
+        ppt_app = win32com.client.Dispatch("PowerPoint.Application")
+        ppt_app.Quit()
+
+    def stats(self):
+        return self.launcher.stats() if self.launches else {}
+
+
+class RecordingBackend(ActionBackend):
+    """
+    Keep every action and deck event in memory instead of performing it, for assertions.
+    """
+
+    name = "recording"
+
+    def __init__(self):
+        super().__init__()
+        # (perf_counter time, action) and (perf_counter time, "open" or "close", deck path)
+        self.actions = []
+        self.deck_events = []
+        self.deck = None
+
+    def perform(self, actions):
+        now = time.perf_counter()
+        for action in actions:
+            self.actions.append((now, action))
+            if action in ACTIONS:
+                self.apply(ACTIONS[action][1])
+
+    def apply(self, key):
+        pass
+
+    def open_deck(self, pptx_path):
+        self.deck = pptx_path
+        self.deck_events.append((time.perf_counter(), "open", pptx_path))
+
+    def close_deck(self):
+        self.deck_events.append((time.perf_counter(), "close", self.deck))
+        self.deck = None
+
+    def performed(self):
+        """
+        Return the performed action names in order.
+        """
+        return [action for _, action in self.actions]
+
+    def clear(self):
+        self.actions = []
+        self.deck_events = []
+
+    def stats(self):
+        return {"actions": len(self.actions), "decks": sum(1 for event in self.deck_events if event[1] == "open")}
+
+
+class SimulatedPresentation(RecordingBackend):
+    """
+    Presentation kept in memory that reacts to PowerPoint's keys like a slide show does.
+
+    Tracks the slide index, whether the slide show is running, whether the
+    screen is blanked and whether the slide's video plays. Keys that
+    PowerPoint ignores in the current state are ignored here as well.
+    slide_count limits the slide index when given.
+    """
+
+    name = "simulated"
+
+    def __init__(self, slide_count=None):
+        super().__init__()
+        self.slide_count = slide_count
+        self.reset()
+
+    def reset(self):
+        self.slide = 1
+        self.slideshow = False
+        self.blank = False
+        self.video_playing = False
+
+    def open_deck(self, pptx_path):
+        super().open_deck(pptx_path)
+        self.reset()
+
+    def apply(self, key):
+        if key == "f5":
+            self.reset()
+            self.slideshow = True
+        elif key == "esc":
+            self.slideshow = self.blank = self.video_playing = False
+        elif not self.slideshow:
+            return
+        elif key == "b":
+            self.blank = not self.blank
+        elif self.blank:
+            # Any other key only brings a blanked slide show back
+            self.blank = False
+        elif key == "space":
+            self.video_playing = not self.video_playing
+        elif key in ("right", "left"):
+            slide = self.slide + (1 if key == "right" else -1)
+            if self.slide_count is not None:
+                slide = min(slide, self.slide_count)
+            if slide >= 1 and slide != self.slide:
+                self.slide = slide
+                self.video_playing = False
+        elif key == "home" or (key == "end" and self.slide_count is not None):
+            slide = 1 if key == "home" else self.slide_count
+            if slide != self.slide:
+                self.slide = slide
+                self.video_playing = False
+
+    def state(self):
+        return {
+            "slide": self.slide,
+            "slideshow": self.slideshow,
+            "blank": self.blank,
+            "video_playing": self.video_playing,
+        }
+
+    def stats(self):
+        stats = super().stats()
+        stats.update(self.state())
+        return stats
+
+
+BACKENDS = {
+    "keyboard": KeyboardBackend,
+    "recording": RecordingBackend,
+    "simulated": SimulatedPresentation,
+}
+
+
+def get_backend(backend):
+    """
+    Return a backend instance for a registered name, or the backend itself when one is given.
+    """
+    if isinstance(backend, str):
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown action backend {backend!r}, expected one of {tuple(BACKENDS)}")
+        return BACKENDS[backend]()
+    return backend
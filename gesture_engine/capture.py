@@ -0,0 +1,159 @@
+import threading
+import time
+
+import cv2
+
+
+class ThreadedCapture:
+    """
+    Read camera frames on a background thread and always hand out the newest one.
+
+    The grabber thread keeps draining the driver buffer into a single slot, so a
+    slow inference loop never processes stale images. Frames that are replaced
+    before anyone reads them are counted as dropped.
+    """
+
+    def __init__(self, source=0, capture=None, read_timeout=1.0):
+        # Allow wrapping an already opened capture (or any object with read/release)
+        self.cap = capture if capture is not None else cv2.VideoCapture(source)
+        self.read_timeout = read_timeout
+
+        self._lock = threading.Condition()
+        self._frame = None
+        self._frame_time = 0.0
+        self._frame_id = 0
+        self._consumed_id = 0
+        self._running = False
+        self._thread = None
+
+        # Counters
+        self.frames_captured = 0
+        self.frames_delivered = 0
+        self.frames_dropped = 0
+        self.read_failures = 0
+
+    def start(self):
+        """
+        Start the background grabber thread.
+        """
+        if self._running:
+            return self
+        self._running = True
+        self._thread = threading.Thread(target=self._grab_loop, name="ThreadedCapture", daemon=True)
+        self._thread.start()
+        return self
+
+    def _grab_loop(self):
+        while self._running:
+            success, frame = self.cap.read()
+            if not success:
+                self.read_failures += 1
+                time.sleep(0.005)
+                continue
+
+            with self._lock:
+                # The previous frame was never handed out, so it is dropped
+                if self._frame_id > self._consumed_id:
+                    self.frames_dropped += 1
+                self._frame = frame
+                self._frame_time = time.perf_counter()
+                self._frame_id += 1
+                self.frames_captured += 1
+                self._lock.notify_all()
+
+    def read(self):
+        """
+        Return (success, frame) for the newest frame not yet delivered.
+
+        Drop-in replacement for cv2.VideoCapture.read. Blocks until a new frame
+        arrives or read_timeout expires.
+        """
+        success, frame, _ = self.read_with_timestamp()
+        return success, frame
+
+    def read_with_timestamp(self):
+        """
+        Return (success, frame, capture_time) where capture_time is time.perf_counter().
+        """
+        if not self._running:
+            self.start()
+
+        with self._lock:
+            has_new = self._lock.wait_for(lambda: self._frame_id > self._consumed_id or not self._running,
+                                          timeout=self.read_timeout)
+            if not has_new or self._frame_id == self._consumed_id:
+                return False, None, 0.0
+            self._consumed_id = self._frame_id
+            self.frames_delivered += 1
+            return True, self._frame, self._frame_time
+
+    def isOpened(self):
+        return self.cap.isOpened()
+
+    def stats(self):
+        """
+        Return a dictionary with the capture counters.
+        """
+        return {
+            "captured": self.frames_captured,
+            "delivered": self.frames_delivered,
+            "dropped": self.frames_dropped,
+            "read_failures": self.read_failures,
+        }
+
+    def release(self):
+        """
+        Stop the grabber thread and release the underlying capture.
+        """
+        self._running = False
+        with self._lock:
+            self._lock.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+        self.cap.release()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.release()
+
+
+class FileCapture:
+    """
+    Read every frame of a video file in order, for batch processing of recordings.
+
+    Unlike ThreadedCapture nothing is dropped: a file is not a live source, so
+    the consumer sets the pace. isOpened() turns False at the end of the file.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.cap = cv2.VideoCapture(path)
+        self.frames_delivered = 0
+        self.ended = not self.cap.isOpened()
+
+    def read(self):
+        if self.ended:
+            return False, None
+        success, frame = self.cap.read()
+        if not success:
+            self.ended = True
+            return False, None
+        self.frames_delivered += 1
+        return True, frame
+
+    def read_with_timestamp(self):
+        success, frame = self.read()
+        return success, frame, time.perf_counter()
+
+    def isOpened(self):
+        return not self.ended
+
+    def stats(self):
+        return {"delivered": self.frames_delivered}
+
+    def release(self):
+        self.ended = True
+        self.cap.release()
@@ -0,0 +1,93 @@
+import numpy as np
+
+from gesture_engine.gestures import GESTURE_IDS
+from gesture_engine.layout import load_layout
+
+
+class GestureClassifier:
+    """
+    Interface every gesture classifier implements.
+
+    classify() labels a single MediaPipe hand with a gesture name and
+    classify_batch() labels an (N, 21, 3) landmark array with gesture ids.
+    required_frames optionally maps gestures to the number of stable frames
+    the debouncer needs before they fire, and combos lists the gesture
+    sequences that trigger actions of their own.
+    """
+
+    name = "base"
+    gestures = ()
+    required_frames = {}
+    combos = ()
+
+    def classify(self, hand_landmarks):
+        raise NotImplementedError
+
+    def classify_batch(self, landmarks):
+        raise NotImplementedError
+
+
+class LayoutClassifier(GestureClassifier):
+    """
+    Classifier backed by a table-driven gesture layout.
+    """
+
+    def __init__(self, layout):
+        self.layout = layout
+        self.name = layout.name
+        self.gestures = layout.gestures
+        self.required_frames = layout.required_frames
+        self.combos = layout.combos
+
+    def classify(self, hand_landmarks):
+        return self.layout.classify(hand_landmarks)
+
+    def classify_batch(self, landmarks):
+        return self.layout.classify_batch(landmarks)
+
+
+class FunctionClassifier(GestureClassifier):
+    """
+    Wrap a plain classify(hand_landmarks) -> gesture name function.
+
+    The batch path rebuilds a hand object per row, so it is only meant for
+    experiments; layouts are the fast path.
+    """
+
+    def __init__(self, name, function, gestures=()):
+        self.name = name
+        self.function = function
+        self.gestures = tuple(gestures)
+
+    def classify(self, hand_landmarks):
+        return self.function(hand_landmarks)
+
+    def classify_batch(self, landmarks):
+        # Imported here so the live path does not pay for protobuf helpers
+        from gesture_engine.replay import list_to_hand
+        return np.array([GESTURE_IDS[self.function(list_to_hand(hand.tolist()))] for hand in landmarks],
+                        dtype=np.int8)
+
+
+# Factories for the built-in classification schemes
+CLASSIFIERS = {
+    "specific": lambda: LayoutClassifier(load_layout("specific")),
+    "counting": lambda: LayoutClassifier(load_layout("counting")),
+    "counting_classic": lambda: LayoutClassifier(load_layout("counting_classic")),
+}
+
+
+def register_classifier(name, factory):
+    """
+    Make a classifier available to get_classifier under the given name.
+    """
+    CLASSIFIERS[name] = factory
+
+
+def get_classifier(name):
+    """
+    Return the classifier registered under name, or one built from a layout file path.
+    """
+    if name in CLASSIFIERS:
+        return CLASSIFIERS[name]()
+    return LayoutClassifier(load_layout(name))
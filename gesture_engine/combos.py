@@ -0,0 +1,67 @@
+import time
+from collections import deque
+
+from gesture_engine.gestures import GESTURE_IDS
+
+# Longest combo length; the recognizer remembers this many gestures
+MAX_COMBO_LENGTH = 3
+
+DEFAULT_WINDOW = 1.5
+
+
+class ComboRecognizer:
+    """
+    Streaming recognizer of timed two- and three-gesture combos over fired gesture ids.
+
+    It is fed the gestures the debouncer fires, so a combo is made of
+    exactly the gestures whose actions were performed. Only the last three
+    are kept, and on each one the last three and then the last two are
+    looked up in a dict of combos, so memory is bounded and every gesture
+    costs the same however many combos are defined. A combo fires when all
+    its gestures fall within its window (seconds from its first gesture to
+    its last); they are then forgotten so they cannot start another combo.
+
+    combos is a list of {"gestures": [...], "action": ..., "window": seconds}
+    entries, as in the "combos" section of a layout file. The single
+    gestures of a combo still perform their own actions before the combo's
+    action runs, which is why sessions leave combos off unless asked.
+    """
+
+    def __init__(self, combos, window=DEFAULT_WINDOW):
+        self.table = {}
+        for combo in combos:
+            gestures = combo["gestures"]
+            if not 2 <= len(gestures) <= MAX_COMBO_LENGTH:
+                raise ValueError(f"Combo {gestures!r} must have 2 to {MAX_COMBO_LENGTH} gestures")
+            key = tuple(GESTURE_IDS[gesture] for gesture in gestures)
+            self.table[key] = (combo["action"], combo.get("window", window))
+
+        self.fired_gestures = deque(maxlen=MAX_COMBO_LENGTH)
+
+        # Counters
+        self.gestures = 0
+        self.fired = 0
+
+    def update(self, gesture_id, now=None):
+        """
+        Add a fired gesture id, fired at time now (session.clock()). Returns the action of a completed combo, or None.
+        """
+        if now is None:
+            now = time.perf_counter()
+        self.gestures += 1
+        self.fired_gestures.append((gesture_id, now))
+
+        for length in range(min(len(self.fired_gestures), MAX_COMBO_LENGTH), 1, -1):
+            recent = list(self.fired_gestures)[-length:]
+            combo = self.table.get(tuple(gesture for gesture, _ in recent))
+            if combo is not None and now - recent[0][1] <= combo[1]:
+                self.fired_gestures.clear()
+                self.fired += 1
+                return combo[0]
+        return None
+
+    def reset(self):
+        self.fired_gestures.clear()
+
+    def stats(self):
+        return {"gestures": self.gestures, "combos": self.fired}
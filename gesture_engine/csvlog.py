@@ -0,0 +1,97 @@
+import atexit
+import csv
+import os
+import threading
+
+
+class BufferedCsvWriter:
+    """
+    Append rows to a CSV file that stays open, writing them in batches off the frame loop.
+
+    writerow() only queues the row. A background thread writes the queue once
+    it holds max_rows rows or max_delay seconds after the last write, and
+    flush() writes it right away (call it at the end of a workflow). Every
+    batch is flushed to the operating system and, with durable, synced to
+    disk, so a crash loses at most max_delay seconds of rows. The writer is
+    also closed, and its queue written, when the interpreter exits.
+    """
+
+    def __init__(self, path, header=None, mode="a", max_rows=32, max_delay=1.0, durable=True):
+        self.path = path
+        self.max_rows = max_rows
+        self.max_delay = max_delay
+        self.durable = durable
+        self.file = open(path, mode=mode, newline="")
+        self._csv = csv.writer(self.file)
+        self._rows = []
+        self._lock = threading.Lock()
+        self._io_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._closed = False
+
+        # Counters
+        self.rows_written = 0
+        self.flushes = 0
+
+        # Only a new or truncated file gets the header
+        if header is not None and self.file.tell() == 0:
+            self._rows.append(header)
+            self.flush()
+
+        self._thread = threading.Thread(target=self._flush_loop, name="BufferedCsvWriter", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def writerow(self, row):
+        """
+        Queue one row; never blocks on disk I/O.
+        """
+        with self._lock:
+            self._rows.append(row)
+            full = len(self._rows) >= self.max_rows
+        if full:
+            self._wakeup.set()
+
+    def _flush_loop(self):
+        while not self._closed:
+            self._wakeup.wait(self.max_delay)
+            self._wakeup.clear()
+            self.flush()
+
+    def flush(self):
+        """
+        Write every queued row to the file now.
+        """
+        with self._io_lock:
+            with self._lock:
+                rows, self._rows = self._rows, []
+            if not rows or self.file.closed:
+                return
+            self._csv.writerows(rows)
+            self.file.flush()
+            if self.durable:
+                os.fsync(self.file.fileno())
+            self.rows_written += len(rows)
+            self.flushes += 1
+
+    def stats(self):
+        return {"rows_written": self.rows_written, "flushes": self.flushes}
+
+    def close(self):
+        """
+        Stop the background thread, write the remaining rows and close the file.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        self._wakeup.set()
+        self._thread.join(timeout=1.0)
+        self.flush()
+        self.file.close()
+        atexit.unregister(self.close)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -0,0 +1,50 @@
+from collections import Counter, deque
+
+
+class GestureDebouncer:
+    """
+    Streaming frame-voting debouncer for per-frame gesture labels.
+
+    A gesture fires once it has been seen in at least `required` of the last
+    `window` frames (per_action can ask more or fewer frames for single
+    gestures). It is then held and cannot fire again until it is released,
+    that is until it fills at most `release` frames of the window, so holding
+    a sign fires exactly once and repeating it means lowering the hand first.
+    """
+
+    def __init__(self, required=5, window=8, release=0, per_action=None):
+        self.required = required
+        self.release = release
+        self.per_action = dict(per_action or {})
+        for action, frames in [(None, required)] + list(self.per_action.items()):
+            if not 0 < frames <= window:
+                raise ValueError(f"Required frames for {action or 'gestures'} must be between 1 and {window}")
+
+        self.frames = deque(maxlen=window)
+        self.counts = Counter()
+        self.held = None
+
+    def update(self, gesture):
+        """
+        Add the label of the next frame. Returns the gesture that fires now, or None.
+        """
+        if len(self.frames) == self.frames.maxlen:
+            self.counts[self.frames[0]] -= 1
+        self.frames.append(gesture)
+        self.counts[gesture] += 1
+
+        # Rearm once the held gesture has faded out of the window
+        if self.held is not None and self.counts[self.held] <= self.release:
+            self.held = None
+
+        if gesture == "UNKNOWN" or gesture == self.held:
+            return None
+        if self.counts[gesture] >= self.per_action.get(gesture, self.required):
+            self.held = gesture
+            return gesture
+        return None
+
+    def reset(self):
+        self.frames.clear()
+        self.counts.clear()
+        self.held = None
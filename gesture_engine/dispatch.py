@@ -0,0 +1,125 @@
+import queue
+import threading
+import time
+
+from gesture_engine.actions import execute_actions
+from gesture_engine.profiling import NULL_PROFILER
+
+
+class ActionDispatcher:
+    """
+    Perform actions on a worker thread so key injection never stalls frame processing.
+
+    Actions are delivered strictly in the order they were dispatched. When the
+    worker falls behind, everything waiting in the queue is coalesced into one
+    batch and injected with a single call. Every action is timestamped when it
+    is queued and when it is delivered to measure dispatch latency; with a
+    profiler the injection time and the end-to-end latency from the frame's
+    capture time are recorded as well.
+    """
+
+    def __init__(self, perform=execute_actions, profiler=NULL_PROFILER):
+        self.perform = perform
+        self.profiler = profiler
+        self.queue = queue.Queue()
+        self._thread = None
+
+        # Counters
+        self.dispatched = 0
+        self.delivered = 0
+        self.batches = 0
+        self.coalesced = 0
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+        self.last_delivery = None
+
+    def start(self):
+        """
+        Start the worker thread.
+        """
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._worker, name="ActionDispatcher", daemon=True)
+            self._thread.start()
+        return self
+
+    def dispatch(self, action, origin_time=None):
+        """
+        Queue an action. origin_time (time.perf_counter) defaults to now.
+        """
+        queued_time = time.perf_counter()
+        self.dispatched += 1
+        self.queue.put((action, queued_time, origin_time if origin_time is not None else queued_time))
+
+    def _worker(self):
+        while True:
+            item = self.queue.get()
+            if item is None:
+                return
+
+            # Drain whatever backed up while the previous batch was being injected
+            batch = [item]
+            stop = False
+            while True:
+                try:
+                    item = self.queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    stop = True
+                    break
+                batch.append(item)
+
+            perform_start = time.perf_counter()
+            try:
+                self.perform([action for action, _, _ in batch])
+            except Exception as e:
+                print(f"Error performing actions: {e}")
+
+            delivered_time = time.perf_counter()
+            self.profiler.record_duration("execute_action", delivered_time - perform_start)
+            self.batches += 1
+            self.coalesced += len(batch) - 1
+            for action, queued_time, origin_time in batch:
+                latency = delivered_time - queued_time
+                self.delivered += 1
+                self.total_latency += latency
+                self.max_latency = max(self.max_latency, latency)
+                self.profiler.record_duration("end_to_end", delivered_time - origin_time)
+                self.last_delivery = (action, origin_time, delivered_time)
+
+            if stop:
+                return
+
+    def wait(self, timeout=1.0):
+        """
+        Wait up to timeout seconds until every dispatched action is delivered. Returns whether it was.
+        """
+        deadline = time.perf_counter() + timeout
+        while self.delivered < self.dispatched:
+            if time.perf_counter() >= deadline:
+                return False
+            time.sleep(0.001)
+        return True
+
+    def close(self, timeout=5.0):
+        """
+        Deliver the remaining actions and stop the worker thread.
+        """
+        if self._thread is not None:
+            self.queue.put(None)
+            self._thread.join(timeout=timeout)
+            self._thread = None
+
+    def stats(self):
+        """
+        Return a dictionary with the dispatch counters and latencies in milliseconds.
+        """
+        mean_latency = self.total_latency / self.delivered if self.delivered else 0.0
+        return {
+            "dispatched": self.dispatched,
+            "delivered": self.delivered,
+            "batches": self.batches,
+            "coalesced": self.coalesced,
+            "mean_latency_ms": round(mean_latency * 1000, 2),
+            "max_latency_ms": round(self.max_latency * 1000, 2),
+        }
@@ -0,0 +1,311 @@
+import time
+
+import cv2
+import mediapipe as mp
+
+from gesture_engine.csvlog import BufferedCsvWriter
+from gesture_engine.gestures import GESTURE_IDS
+from gesture_engine.landmarks import finger_mask
+from gesture_engine.layout import MASK_COUNTS
+from gesture_engine.session import GestureSession
+from gesture_engine.workflows import DEAD, compile_workflow
+
+# Initialize MediaPipe drawing helpers
+mp_hands = mp.solutions.hands
+mp_drawing = mp.solutions.drawing_utils
+
+LANDMARK_STYLE = mp_drawing.DrawingSpec(color=(0, 0, 255), thickness=2, circle_radius=4)
+CONNECTION_STYLE = mp_drawing.DrawingSpec(color=(0, 255, 0), thickness=2)
+
+ERROR_LOG_FILE = "logs/error_log.csv"
+
+# Finger states of every 5-bit finger mask, thumb first
+MASK_STATES = tuple(tuple("UP" if mask >> i & 1 else "DOWN" for i in range(5)) for mask in range(32))
+
+
+def count_fingers(hand_landmarks):
+    """
+    Count fingers based on hand landmarks and detect thumb extension.
+
+    Returns the number of raised fingers and their states as a list of
+    "UP"/"DOWN" strings in [thumb, index, middle, ring, pinky] order.
+    """
+    mask = finger_mask(hand_landmarks)
+    return MASK_COUNTS[mask], list(MASK_STATES[mask])
+
+
+def draw_hand(frame, hand_landmarks):
+    """
+    Draw the hand landmarks and their connections onto the frame.
+    """
+    mp_drawing.draw_landmarks(frame, hand_landmarks, mp_hands.HAND_CONNECTIONS,
+                              LANDMARK_STYLE, CONNECTION_STYLE)
+
+
+def show_frame(session, frame, window_title, hands=None, texts=()):
+    """
+    Draw the hands and text overlays, show the frame and poll the keyboard.
+
+    Returns True when the user asked to quit, with Q in the preview window or
+    with Ctrl+C in headless mode, where nothing is drawn or shown at all.
+    """
+    if session.headless:
+        return session.stop_requested()
+
+    render_start = time.perf_counter()
+    frame = session.preprocessor.display(frame)
+    hands = session.preprocessor.display_hands(hands)
+    for hand_landmarks in hands or ():
+        draw_hand(frame, hand_landmarks)
+    for text, position, color in texts:
+        cv2.putText(frame, text, position, cv2.FONT_HERSHEY_SIMPLEX, 1, color, 2)
+    cv2.imshow(window_title, frame)
+    quit_requested = cv2.waitKey(5) & 0xFF == ord('q')
+    render_seconds = time.perf_counter() - render_start
+    session.record_render(render_seconds)
+    session.profiler.record_duration("render", render_seconds)
+    return quit_requested
+
+
+def close_windows(session):
+    """
+    Close the preview windows, if any were opened.
+    """
+    if not session.headless:
+        cv2.destroyAllWindows()
+
+
+def detect_hands(session, frame):
+    """
+    Run the hand model on a BGR frame.
+
+    Returns None when the session's governor skips this frame, or when the
+    asynchronous model has no new result, so callers can tell a skipped frame
+    apart from one without hands.
+    """
+    profiler = session.profiler
+    governor = session.governor
+    if governor is not None:
+        now = session.clock()
+        if not governor.should_process(now):
+            return None
+        cpu_start = time.process_time()
+
+    start = profiler.now()
+    frame_rgb = session.preprocessor.to_rgb(frame)
+    profiler.record("cv2.cvtColor", start)
+
+    start = profiler.now()
+    results = session.hands.process(frame_rgb)
+    profiler.record("hands.process", start)
+
+    # An out-of-process model may not have a new result yet
+    if results is None:
+        return None
+    if governor is not None:
+        governor.update(bool(results.multi_hand_landmarks), now, time.process_time() - cpu_start)
+    return results
+
+
+class ErrorLogger:
+    """
+    Callable error logger for run_workflow that appends rows to a CSV file.
+
+    The file is opened on the first error and kept open; rows are written in
+    batches by a BufferedCsvWriter and flushed when a workflow ends.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.writer = None
+
+    def __call__(self, step, expected, detected, flow_number, gesture_type):
+        if self.writer is None:
+            self.writer = BufferedCsvWriter(self.path)
+        self.writer.writerow([time.strftime("%Y-%m-%d %H:%M:%S"), gesture_type, flow_number, step, detected, expected])
+
+    def flush(self):
+        if self.writer is not None:
+            self.writer.flush()
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+            self.writer = None
+
+
+# Log errors into a CSV file with error type
+log_error = ErrorLogger(ERROR_LOG_FILE)
+
+
+def run_workflow(workflow, flow_number, classifier, gesture_type, session=None,
+                 error_logger=log_error):
+    """
+    Process a single workflow, track time, and log errors.
+
+    The workflow starts once its first gesture fires. After that every fired
+    gesture either completes the expected step or is logged as an error.
+    workflow is a list of steps or a CompiledWorkflow; steps are matched by
+    the compiled DFA, so optional, repeated and alternative steps work.
+    Gestures fire through the session's frame-voting debouncer. Returns
+    (elapsed_time, error_count).
+
+    When the session profiles, the per-stage latency summary of this run is
+    printed on return.
+    """
+    owns_session = session is None
+    if owns_session:
+        session = GestureSession()
+    session.begin_run()
+    cap = session.cap
+    profiler = session.profiler
+    preprocessor = session.preprocessor
+    debouncer = session.debouncer(classifier)
+    workflow = compile_workflow(workflow)
+
+    state = workflow.start
+    step_index = 0
+    start_time = None
+    workflow_started = False  # Flag to indicate workflow start
+    error_count = 0
+    gesture = "UNKNOWN"
+
+    try:
+        while not workflow.accepting[state]:
+            start = profiler.now()
+            success, frame, capture_time = cap.read_with_timestamp()
+            profiler.record("cap.read", start)
+            if not success:
+                # A finished replay never produces another frame
+                if not cap.isOpened():
+                    break
+                continue
+
+            start = profiler.now()
+            frame = preprocessor.mirror(frame)
+            profiler.record("cv2.flip", start)
+            results = detect_hands(session, frame)
+            hands = None
+
+            # Frames skipped by the governor carry no new information for the debouncer
+            if results is not None:
+                hands = results.multi_hand_landmarks
+                gesture = "UNKNOWN"
+                start = profiler.now()
+                for hand_landmarks in hands or ():
+                    gesture = classifier.classify(hand_landmarks)
+                profiler.record("classify", start)
+                if session.first_classified is None:
+                    session.mark_first_classified()
+
+                fired = debouncer.update(gesture)
+                if fired is not None:
+                    target = workflow.step(state, GESTURE_IDS[fired])
+                    if not workflow_started and target != DEAD:
+                        start_time = session.clock()
+                        workflow_started = True
+
+                    if workflow_started:  # Only process gestures and log errors after workflow starts
+                        if target != DEAD:
+                            session.dispatch(fired, capture_time)
+                            state = target
+                            step_index += 1
+                        else:
+                            error_count += 1
+                            error_logger(step_index + 1, workflow.expected[state], fired, flow_number, gesture_type)
+
+            # Display the frame with the step and the current gesture
+            texts = () if session.headless else [
+                (f"Step: {step_index + 1}/{len(workflow)}", (10, 50), (255, 0, 0)),
+                (f"{gesture}", (10, 150), (0, 255, 255)),
+            ]
+            if show_frame(session, frame, "Hand Gesture Workflow - Press Q to Quit", hands, texts):
+                break
+    finally:
+        close_windows(session)
+        # Make this run's errors durable before the next one starts
+        if hasattr(error_logger, "flush"):
+            error_logger.flush()
+        if profiler.enabled and session.dispatcher is not None:
+            # Let the run's last actions land in its own summary, not the next run's
+            session.dispatcher.wait()
+        profiler.report(f"{gesture_type} workflow {flow_number} latency summary", run=True)
+        profiler.reset()
+        if owns_session:
+            session.close()
+
+    if workflow_started:
+        elapsed_time = session.clock() - start_time
+        print(f"Workflow completed in {elapsed_time:.2f} seconds.")
+        return elapsed_time, error_count
+    else:
+        print("Workflow was not started.")
+        return 0, error_count
+
+
+def run_live(classifier, session, window_title="Hand Gesture Control - Press Q to Quit",
+             show_finger_count=False):
+    """
+    Run free gesture control: execute every gesture that fires through the debouncer.
+
+    Gesture combos of the classifier are recognized over the fired gestures
+    and their actions executed as well.
+    """
+    cap = session.cap
+    profiler = session.profiler
+    preprocessor = session.preprocessor
+    debouncer = session.debouncer(classifier)
+    combos = session.combo_recognizer(classifier)
+
+    try:
+        while True:
+            start = profiler.now()
+            success, frame, capture_time = cap.read_with_timestamp()
+            profiler.record("cap.read", start)
+            if not success:
+                # A finished replay never produces another frame
+                if not cap.isOpened():
+                    break
+                continue
+
+            start = profiler.now()
+            frame = preprocessor.mirror(frame)
+            profiler.record("cv2.flip", start)
+            results = detect_hands(session, frame)
+            hands = None
+            texts = []
+
+            # Frames skipped by the governor carry no new information for the debouncer
+            if results is not None:
+                hands = results.multi_hand_landmarks
+                gesture = "UNKNOWN"
+                for hand_landmarks in hands or ():
+                    # Detect gesture
+                    start = profiler.now()
+                    gesture = classifier.classify(hand_landmarks)
+                    profiler.record("classify", start)
+
+                    if not session.headless:
+                        if show_finger_count:
+                            finger_count, _ = count_fingers(hand_landmarks)
+                            texts.append((f"Fingers: {finger_count}", (10, 50), (0, 255, 0)))
+                        texts.append((f"Gesture: {gesture}", (10, 100), (0, 0, 255)))
+
+                if session.first_classified is None:
+                    session.mark_first_classified()
+
+                # Execute the action once the gesture is stable
+                fired = debouncer.update(gesture)
+                if fired is not None:
+                    session.dispatch(fired, capture_time)
+                    if combos is not None:
+                        combo = combos.update(GESTURE_IDS[fired], session.clock())
+                        if combo is not None:
+                            session.dispatch(combo, capture_time)
+
+            if show_frame(session, frame, window_title, hands, texts):
+                break
+    finally:
+        close_windows(session)
+        if combos is not None:
+            print(f"Combo stats: {combos.stats()}")
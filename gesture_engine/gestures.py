@@ -0,0 +1,32 @@
+# Every gesture name used by any layout, with a stable integer id for array code
+GESTURES = (
+    "UNKNOWN",
+    "PRESENTATION_MODE_ON",
+    "PRESENTATION_MODE_OFF",
+    "NEXT_SLIDE",
+    "PREVIOUS_SLIDE",
+    "PLAY_VIDEO",
+    "STOP_VIDEO",
+    "QUESTION_BLOCK",
+    "ENTER_PRESENTATION",
+    "EXIT_PRESENTATION",
+    "BLANK_SCREEN",
+)
+
+GESTURE_IDS = {name: gesture_id for gesture_id, name in enumerate(GESTURES)}
+
+UNKNOWN = GESTURE_IDS["UNKNOWN"]
+
+
+def gesture_id(name):
+    """
+    Return the integer id of a gesture name.
+    """
+    return GESTURE_IDS[name]
+
+
+def gesture_name(gesture_id):
+    """
+    Return the gesture name of an integer id.
+    """
+    return GESTURES[gesture_id]
@@ -0,0 +1,77 @@
+import time
+
+import psutil
+
+
+class InferenceGovernor:
+    """
+    Throttle hand inference while nobody is in view.
+
+    Every frame is processed (up to max_rate per second) while a hand is
+    visible. Once no hand has been seen for idle_after seconds the governor
+    drops to probing at min_rate, and returns to full rate as soon as a probe
+    finds a hand again.
+    """
+
+    def __init__(self, min_rate=2.0, max_rate=None, idle_after=2.0):
+        self.min_interval = 1.0 / min_rate
+        self.max_interval = 1.0 / max_rate if max_rate else 0.0
+        self.idle_after = idle_after
+
+        self.last_hand_time = None
+        self.last_process_time = None
+        self.idle = False
+
+        # Counters
+        self.processed = 0
+        self.skipped = 0
+        self.inference_cpu = 0.0
+        self.process = psutil.Process()
+        self.process.cpu_percent()  # Start measuring CPU usage from here
+        self.start_cpu = self.process.cpu_times()
+        self.start_time = time.monotonic()
+
+    def should_process(self, now):
+        """
+        Tell whether the frame arriving at time now should go through the hand model.
+        """
+        if self.last_process_time is None:
+            return True
+        interval = self.min_interval if self.idle else self.max_interval
+        if now - self.last_process_time >= interval:
+            return True
+        self.skipped += 1
+        return False
+
+    def update(self, hand_found, now, cpu_seconds=0.0):
+        """
+        Record the outcome of a processed frame and the CPU time it took.
+        """
+        self.processed += 1
+        self.inference_cpu += cpu_seconds
+        self.last_process_time = now
+        if hand_found or self.last_hand_time is None:
+            self.last_hand_time = now
+        self.idle = not hand_found and now - self.last_hand_time >= self.idle_after
+
+    def saved_cpu_seconds(self):
+        """
+        Estimated CPU time saved by the skipped frames, from the average inference cost.
+        """
+        if not self.processed:
+            return 0.0
+        return self.skipped * self.inference_cpu / self.processed
+
+    def stats(self):
+        """
+        Return the governor counters together with the process CPU usage measured by psutil.
+        """
+        cpu = self.process.cpu_times()
+        return {
+            "processed": self.processed,
+            "skipped": self.skipped,
+            "saved_cpu_seconds": round(self.saved_cpu_seconds(), 2),
+            "process_cpu_seconds": round(cpu.user + cpu.system - self.start_cpu.user - self.start_cpu.system, 2),
+            "process_cpu_percent": self.process.cpu_percent(),
+            "wall_seconds": round(time.monotonic() - self.start_time, 2),
+        }
@@ -0,0 +1,190 @@
+import multiprocessing
+import queue
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from gesture_engine.replay import list_to_hand
+
+
+class LandmarkResults:
+    """
+    Hands.process style result built from a compact (N, 21, 3) landmark array.
+
+    The MediaPipe landmark objects the classifiers and drawing code expect
+    are only built when multi_hand_landmarks is first read.
+    """
+
+    def __init__(self, landmarks):
+        self.landmarks = landmarks
+        self.multi_handedness = None
+        self._hands = None
+
+    @property
+    def multi_hand_landmarks(self):
+        # MediaPipe reports None, not an empty list, when no hand is visible
+        if not len(self.landmarks):
+            return None
+        if self._hands is None:
+            self._hands = [list_to_hand(hand.tolist()) for hand in self.landmarks]
+        return self._hands
+
+
+def inference_worker(memory_name, frame_shape, slots, requests, responses, hands_options, roi_options):
+    """
+    Worker process body: run Hands on frames from the shared ring and answer with landmark arrays.
+    """
+    import mediapipe as mp
+
+    from gesture_engine.landmarks import results_to_array
+    from gesture_engine.roi import RoiHands
+
+    memory = shared_memory.SharedMemory(name=memory_name)
+    frames = np.ndarray((slots,) + frame_shape, dtype=np.uint8, buffer=memory.buf)
+    hands = mp.solutions.hands.Hands(**hands_options)
+    if roi_options is not None:
+        crop_hands = mp.solutions.hands.Hands(**hands_options) if roi_options["track"] else None
+        hands = RoiHands(hands, crop_hands, **roi_options)
+
+    try:
+        while True:
+            request = requests.get()
+            if request is None:
+                break
+            slot, sequence = request
+            results = hands.process(frames[slot])
+            responses.put(("result", slot, sequence, results_to_array(results)))
+    finally:
+        if roi_options is not None:
+            responses.put(("roi", hands.stats()))
+        hands.close()
+        del frames
+        memory.close()
+
+
+class AsyncHands:
+    """
+    Drop-in for Hands that runs the model in a separate process.
+
+    Frames are copied once into a shared-memory ring of `slots` frame slots
+    and only the slot number crosses the process boundary; the worker
+    answers with compact landmark arrays. process() never waits for the
+    model: it submits the frame if a slot is free (otherwise the frame is
+    dropped) and returns the newest result that arrived since the last call,
+    or None when there is none, like a frame skipped by the governor. ROI
+    tracking and downscaling, when asked for, run inside the worker.
+    """
+
+    def __init__(self, hands_options, roi_options=None, slots=3):
+        self.hands_options = hands_options
+        self.roi_options = roi_options
+        self.slots = slots
+        self.frame_shape = None
+        self.memory = None
+        self.frames = None
+        self.process_handle = None
+        self.requests = None
+        self.responses = None
+        self.free_slots = []
+        self.sequence = 0
+        self.latest = None
+        self.latest_sequence = 0
+
+        # Counters
+        self.submitted = 0
+        self.completed = 0
+        self.dropped = 0
+        self.superseded = 0
+        self.roi_stats = None
+
+    def _start(self, frame_shape):
+        self.frame_shape = frame_shape
+        self.memory = shared_memory.SharedMemory(create=True, size=self.slots * int(np.prod(frame_shape)))
+        self.frames = np.ndarray((self.slots,) + frame_shape, dtype=np.uint8, buffer=self.memory.buf)
+        self.free_slots = list(range(self.slots))
+
+        # Spawn gives the worker a fresh interpreter, as on Windows, instead of forking MediaPipe state
+        context = multiprocessing.get_context("spawn")
+        self.requests = context.Queue()
+        self.responses = context.Queue()
+        process_handle = context.Process(
+            target=inference_worker, name="AsyncHands", daemon=True,
+            args=(self.memory.name, frame_shape, self.slots, self.requests, self.responses,
+                  self.hands_options, self.roi_options))
+        process_handle.start()
+        # Only a started worker is stopped by close()
+        self.process_handle = process_handle
+
+    def _collect(self):
+        """
+        Take every response that is already waiting, without blocking.
+        """
+        while True:
+            try:
+                response = self.responses.get_nowait()
+            except queue.Empty:
+                return
+            if response[0] == "roi":
+                self.roi_stats = response[1]
+            else:
+                _, slot, sequence, landmarks = response
+                self.free_slots.append(slot)
+                self.completed += 1
+                if sequence > self.latest_sequence:
+                    if self.latest is not None:
+                        self.superseded += 1
+                    self.latest = LandmarkResults(landmarks)
+                    self.latest_sequence = sequence
+
+    def process(self, frame_rgb):
+        """
+        Submit a frame and return the newest finished result, or None.
+
+        Raises RuntimeError once the worker has died, instead of returning
+        None for every later frame as if the hand model were just busy.
+        """
+        if self.frames is None:
+            self._start(frame_rgb.shape)
+        self._collect()
+        if not self.process_handle.is_alive():
+            raise RuntimeError(f"Hand model worker stopped unexpectedly (exit code {self.process_handle.exitcode})")
+
+        if self.free_slots and frame_rgb.shape == self.frame_shape:
+            slot = self.free_slots.pop()
+            np.copyto(self.frames[slot], frame_rgb)
+            self.sequence += 1
+            self.requests.put((slot, self.sequence))
+            self.submitted += 1
+        else:
+            self.dropped += 1
+
+        results, self.latest = self.latest, None
+        return results
+
+    def stats(self):
+        stats = {
+            "submitted": self.submitted,
+            "completed": self.completed,
+            "dropped": self.dropped,
+            "superseded": self.superseded,
+        }
+        if self.roi_stats is not None:
+            stats["roi"] = self.roi_stats
+        return stats
+
+    def close(self):
+        """
+        Stop the worker and free the shared memory.
+        """
+        if self.process_handle is not None:
+            self.requests.put(None)
+            self.process_handle.join(timeout=5.0)
+            self._collect()
+            if self.process_handle.is_alive():
+                self.process_handle.terminate()
+            self.process_handle = None
+        if self.memory is not None:
+            self.frames = None
+            self.memory.close()
+            self.memory.unlink()
+            self.memory = None
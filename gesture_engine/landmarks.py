@@ -0,0 +1,87 @@
+import numpy as np
+
+# Landmark indices
+THUMB_BASE = 2
+THUMB_TIP = 4
+INDEX_TIP = 8
+FINGER_TIPS = np.array([8, 12, 16, 20])  # Index, Middle, Ring, Pinky
+FINGER_PIPS = FINGER_TIPS - 2
+
+# Thresholds in normalized image coordinates
+THUMB_EXTENSION = 0.1
+TOUCH_DISTANCE = 0.05
+
+# Bit of each finger in a finger mask, in [thumb, index, middle, ring, pinky] order
+FINGER_BITS = 1 << np.arange(5)
+FINGER_TIP_BITS = ((8, 2), (12, 4), (16, 8), (20, 16))
+
+
+def hand_to_array(hand_landmarks):
+    """
+    Convert one MediaPipe hand into a (21, 3) float32 array of x, y, z.
+    """
+    return np.fromiter(
+        (value for lm in hand_landmarks.landmark for value in (lm.x, lm.y, lm.z)),
+        dtype=np.float32, count=63,
+    ).reshape(21, 3)
+
+
+def results_to_array(results):
+    """
+    Convert every hand in a Hands.process result into an (N, 21, 3) float32 array.
+    """
+    if not results.multi_hand_landmarks:
+        return np.empty((0, 21, 3), dtype=np.float32)
+    return np.stack([hand_to_array(hand) for hand in results.multi_hand_landmarks])
+
+
+def finger_states_batch(landmarks):
+    """
+    Return an (N, 5) bool array of [thumb, index, middle, ring, pinky] "UP" states.
+
+    Same rules as count_fingers: a finger is up when its tip is above its PIP
+    joint, the thumb when its tip is far enough sideways from its base.
+    """
+    fingers = landmarks[:, FINGER_TIPS, 1] < landmarks[:, FINGER_PIPS, 1]
+    # Subtract in double precision, like the protobuf attribute version does
+    thumb_offset = landmarks[:, THUMB_TIP, 0].astype(np.float64) - landmarks[:, THUMB_BASE, 0]
+    thumb = np.abs(thumb_offset) > THUMB_EXTENSION
+    return np.column_stack((thumb, fingers))
+
+
+def thumb_index_touch_batch(landmarks):
+    """
+    Return an (N,) bool array telling whether the thumb and index tips touch.
+    """
+    offset = landmarks[:, THUMB_TIP, :2].astype(np.float64) - landmarks[:, INDEX_TIP, :2]
+    return np.all(np.abs(offset) < TOUCH_DISTANCE, axis=1)
+
+
+def finger_mask(hand_landmarks):
+    """
+    Pack the finger states of one MediaPipe hand into a 5-bit integer.
+
+    Bit 0 is the thumb, bits 1-4 the index, middle, ring and pinky fingers.
+    """
+    lm = hand_landmarks.landmark
+    mask = 1 if abs(lm[THUMB_TIP].x - lm[THUMB_BASE].x) > THUMB_EXTENSION else 0
+    for tip_index, bit in FINGER_TIP_BITS:
+        if lm[tip_index].y < lm[tip_index - 2].y:
+            mask |= bit
+    return mask
+
+
+def finger_masks_batch(landmarks):
+    """
+    Return an (N,) array of 5-bit finger masks for an (N, 21, 3) batch.
+    """
+    return finger_states_batch(landmarks) @ FINGER_BITS
+
+
+def thumb_index_touch(hand_landmarks):
+    """
+    Tell whether the thumb and index tips of one MediaPipe hand touch.
+    """
+    thumb = hand_landmarks.landmark[THUMB_TIP]
+    index = hand_landmarks.landmark[INDEX_TIP]
+    return abs(thumb.x - index.x) < TOUCH_DISTANCE and abs(thumb.y - index.y) < TOUCH_DISTANCE
@@ -0,0 +1,109 @@
+import os
+import time
+
+LAUNCH_TIMEOUT = 30.0
+POLL_INTERVAL = 0.2
+
+
+class PresentationLauncher:
+    """
+    Open PowerPoint decks and wait until they can take key presses, timing every launch.
+
+    open() only starts PowerPoint, so the deck can load while the camera and
+    hand model warm up. wait_ready() then polls until the deck's window
+    exists and PowerPoint answers COM calls with the deck open, instead of
+    sleeping a fixed time, and gives the window the keyboard focus. A deck
+    that is not ready within the timeout of the wait is used anyway, as
+    before.
+    """
+
+    def __init__(self, timeout=LAUNCH_TIMEOUT, poll_interval=POLL_INTERVAL):
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+        self.path = None
+        self.opened_at = None
+        self.launches = []
+
+    def open(self, pptx_path):
+        """
+        Start opening a deck without waiting for it. Returns self.
+        """
+        self.path = os.path.abspath(pptx_path)
+        self.opened_at = time.perf_counter()
+        os.startfile(self.path)
+        return self
+
+    def _window(self):
+        import pygetwindow
+
+        title = os.path.splitext(os.path.basename(self.path))[0]
+        windows = pygetwindow.getWindowsWithTitle(title)
+        return windows[0] if windows else None
+
+    def _deck_loaded(self):
+        import win32com.client
+
+        try:
+            app = win32com.client.Dispatch("PowerPoint.Application")
+            # PowerPoint rejects calls while it is still busy loading
+            for presentation in app.Presentations:
+                if os.path.normcase(presentation.FullName) == os.path.normcase(self.path):
+                    return True
+        except Exception:
+            pass
+        return False
+
+    def wait_ready(self):
+        """
+        Wait until the deck opened last is ready and focused. Returns the launch record.
+        """
+        # The timeout counts from here, not from open(): a deck preloaded during a
+        # long warm-up still gets the full timeout, and is always polled at least once
+        deadline = time.perf_counter() + self.timeout
+        while True:
+            window = self._window()
+            ready = window is not None and self._deck_loaded()
+            if ready or time.perf_counter() >= deadline:
+                break
+            time.sleep(self.poll_interval)
+
+        self._focus(window)
+        opened_at, self.opened_at = self.opened_at, None
+        launch = {
+            "deck": os.path.basename(self.path),
+            "seconds": round(time.perf_counter() - opened_at, 3),
+            "ready": ready,
+        }
+        self.launches.append(launch)
+        if not ready:
+            print(f"{launch['deck']} was not ready after {self.timeout:.0f} seconds, continuing anyway.")
+        return launch
+
+    def launch(self, pptx_path):
+        """
+        Open a deck, unless open() already started it, and wait until it is ready.
+        """
+        if self.opened_at is None or self.path != os.path.abspath(pptx_path):
+            self.open(pptx_path)
+        return self.wait_ready()
+
+    def _focus(self, window):
+        try:
+            if window is not None:
+                window.activate()
+                return
+        except Exception:
+            pass
+        # Fall back to clicking into whatever is in front, as the fixed-delay launch did
+        import pyautogui
+
+        pyautogui.click()
+
+    def stats(self):
+        seconds = [launch["seconds"] for launch in self.launches]
+        return {
+            "launches": len(self.launches),
+            "not_ready": sum(1 for launch in self.launches if not launch["ready"]),
+            "mean_seconds": round(sum(seconds) / len(seconds), 3) if seconds else 0.0,
+            "max_seconds": max(seconds, default=0.0),
+        }
@@ -0,0 +1,124 @@
+import json
+import os
+
+import numpy as np
+
+from gesture_engine.gestures import GESTURE_IDS, GESTURES, UNKNOWN
+from gesture_engine.landmarks import (finger_mask, finger_masks_batch, thumb_index_touch,
+                                      thumb_index_touch_batch)
+
+LAYOUT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "layouts")
+
+# Number of finger states and the resulting size of a lookup table
+FINGER_COUNT = 5
+TABLE_SIZE = 1 << FINGER_COUNT
+
+# Geometric checks a rule can require, as (single hand, batch) implementations
+CHECKS = {
+    "thumb_index_touch": (thumb_index_touch, thumb_index_touch_batch),
+}
+
+# Raised finger count of every 5-bit finger mask
+MASK_COUNTS = tuple(bin(mask).count("1") for mask in range(TABLE_SIZE))
+
+
+def parse_fingers(fingers):
+    """
+    Turn a finger pattern like "DUUDD" (thumb first) into a 5-bit mask.
+    """
+    if len(fingers) != FINGER_COUNT or set(fingers) - {"U", "D"}:
+        raise ValueError(f"Invalid finger pattern {fingers!r}, expected 5 of 'U'/'D'")
+    return sum(1 << i for i, state in enumerate(fingers) if state == "U")
+
+
+class GestureLayout:
+    """
+    Gesture map resolved into a 32-entry lookup table indexed by finger mask.
+
+    Rules are tried in order and the first one matching a mask owns it. A rule
+    matches either an exact finger pattern or a raised finger count, and may
+    name a geometric check; when that check fails the hand is UNKNOWN. A rule
+    can also set "frames", the number of stable frames the debouncer needs
+    before that gesture fires. Optional combos are sequences of gestures
+    that trigger an action of their own (see ComboRecognizer).
+    """
+
+    def __init__(self, name, rules, combos=()):
+        self.name = name
+        self.rules = rules
+        self.combos = list(combos)
+        self.gesture_table = [UNKNOWN] * TABLE_SIZE
+        self.check_table = [None] * TABLE_SIZE
+        self.required_frames = {rule["gesture"]: rule["frames"] for rule in rules if "frames" in rule}
+
+        claimed = [False] * TABLE_SIZE
+        for rule in rules:
+            gesture = GESTURE_IDS[rule["gesture"]]
+            check = rule.get("check")
+            if check is not None and check not in CHECKS:
+                raise ValueError(f"Unknown check {check!r} in layout {name!r}")
+
+            if "fingers" in rule:
+                masks = [parse_fingers(rule["fingers"])]
+            else:
+                masks = [mask for mask in range(TABLE_SIZE) if MASK_COUNTS[mask] == rule["count"]]
+
+            for mask in masks:
+                if not claimed[mask]:
+                    claimed[mask] = True
+                    self.gesture_table[mask] = gesture
+                    self.check_table[mask] = check
+
+        self.gesture_array = np.array(self.gesture_table, dtype=np.int8)
+        self.checked_masks = [mask for mask in range(TABLE_SIZE) if self.check_table[mask]]
+        self.gestures = sorted({GESTURES[gesture] for gesture in self.gesture_table if gesture != UNKNOWN})
+
+    @classmethod
+    def from_file(cls, path):
+        with open(path) as file:
+            data = json.load(file)
+        return cls(data.get("name", os.path.splitext(os.path.basename(path))[0]), data["rules"],
+                   data.get("combos", ()))
+
+    def classify_mask(self, mask, hand_landmarks=None):
+        """
+        Return the gesture name for a finger mask, running the rule's check if any.
+        """
+        check = self.check_table[mask]
+        if check is not None and not CHECKS[check][0](hand_landmarks):
+            return "UNKNOWN"
+        return GESTURES[self.gesture_table[mask]]
+
+    def classify(self, hand_landmarks):
+        """
+        Return the gesture name for one MediaPipe hand.
+        """
+        return self.classify_mask(finger_mask(hand_landmarks), hand_landmarks)
+
+    def classify_batch(self, landmarks):
+        """
+        Return gesture ids for an (N, 21, 3) batch of hands.
+        """
+        masks = finger_masks_batch(landmarks)
+        gesture_ids = self.gesture_array[masks]
+        for mask in self.checked_masks:
+            rows = np.flatnonzero(masks == mask)
+            if len(rows):
+                passed = CHECKS[self.check_table[mask]][1](landmarks[rows])
+                gesture_ids[rows[~passed]] = UNKNOWN
+        return gesture_ids
+
+
+_layouts = {}
+
+
+def load_layout(name_or_path):
+    """
+    Load a layout by name from gesture_engine/layouts, or from a JSON file path.
+    """
+    if name_or_path not in _layouts:
+        path = name_or_path
+        if not os.path.exists(path):
+            path = os.path.join(LAYOUT_DIR, f"{name_or_path}.json")
+        _layouts[name_or_path] = GestureLayout.from_file(path)
+    return _layouts[name_or_path]
@@ -0,0 +1,224 @@
+import multiprocessing
+import queue
+import time
+
+from gesture_engine.actions import execute_actions
+from gesture_engine.classifiers import get_classifier
+from gesture_engine.dispatch import ActionDispatcher
+from gesture_engine.engine import detect_hands
+from gesture_engine.session import GestureSession
+
+
+def stream_session_options(source, options=None):
+    """
+    GestureSession keyword arguments for one stream.
+
+    source is a camera index, a landmark recording (.jsonl) or a video file.
+    Workers never draw or perform actions themselves. They already run the
+    hand model in a process of their own, and as daemon processes they may
+    not start another one, so async_inference is always off.
+    """
+    options = dict(options or {}, headless=True, dispatch_actions=False, async_inference=False)
+    if isinstance(source, int) or str(source).isdigit():
+        options["camera_index"] = int(source)
+    elif str(source).endswith(".jsonl"):
+        options["replay_path"] = source
+    else:
+        options["camera_index"] = source
+    return options
+
+
+def stream_worker(stream_id, source, classifier_name, options, events, stop, report_interval):
+    """
+    Worker process body: run one stream through its own session and Hands graph.
+
+    Fired gestures are sent to the coordinator as ("gesture", stream_id,
+    gesture, time.monotonic()), progress as ("stats", stream_id, frames,
+    seconds) every report_interval seconds, and ("done", ...) at the end.
+    """
+    session = GestureSession(**stream_session_options(source, options))
+    classifier = get_classifier(classifier_name)
+    session.open()
+    cap = session.cap
+    debouncer = session.debouncer(classifier)
+
+    frames = 0
+    start_time = last_report = time.perf_counter()
+    try:
+        while not stop.is_set() and not session.stop_requested():
+            success, frame, _ = cap.read_with_timestamp()
+            if not success:
+                if not cap.isOpened():
+                    break
+                continue
+            frames += 1
+
+            results = detect_hands(session, session.preprocessor.mirror(frame))
+            if results is not None:
+                gesture = "UNKNOWN"
+                for hand_landmarks in results.multi_hand_landmarks or ():
+                    gesture = classifier.classify(hand_landmarks)
+                fired = debouncer.update(gesture)
+                if fired is not None:
+                    events.put(("gesture", stream_id, fired, time.monotonic()))
+
+            now = time.perf_counter()
+            if now - last_report >= report_interval:
+                events.put(("stats", stream_id, frames, now - start_time))
+                last_report = now
+    finally:
+        session.close()
+        events.put(("done", stream_id, frames, time.perf_counter() - start_time))
+
+
+class StreamCoordinator:
+    """
+    Run several cameras or recorded streams in worker processes and merge their gestures.
+
+    Every stream gets its own process, session and MediaPipe Hands graph, so
+    throughput grows with the number of cores. The coordinator turns the
+    gestures of all streams into one action stream: a gesture fired by
+    another stream within merge_window seconds of the same gesture is taken
+    to be the same movement seen by a second camera and merged (0 keeps
+    every event, for batches of unrelated recordings). Per-stream frame
+    rates are printed every report_interval seconds and when the run ends.
+    """
+
+    def __init__(self, sources, classifier="specific", session_options=None, perform=execute_actions,
+                 merge_window=0.5, report_interval=5.0):
+        self.sources = list(sources)
+        self.classifier = classifier
+        self.session_options = session_options or {}
+        self.perform = perform
+        self.merge_window = merge_window
+        self.report_interval = report_interval
+        self.processes = []
+        self.events = None
+        self.stop = None
+        self.dispatcher = None
+
+        self.streams = [{"source": str(source), "frames": 0, "seconds": 0.0, "gestures": 0, "done": False}
+                        for source in self.sources]
+        self.last_fired = {}
+        self.actions = 0
+        self.merged = 0
+        self.start_time = None
+        self.end_time = None
+
+    def start(self):
+        """
+        Start one worker process per stream and the action dispatcher.
+        """
+        # Spawn gives every worker a fresh interpreter, as on Windows, instead of forking MediaPipe state
+        context = multiprocessing.get_context("spawn")
+        self.events = context.Queue()
+        self.stop = context.Event()
+        self.dispatcher = ActionDispatcher(self.perform).start()
+        for stream_id, source in enumerate(self.sources):
+            process = context.Process(target=stream_worker, name=f"stream-{stream_id}", daemon=True,
+                                      args=(stream_id, source, self.classifier, self.session_options,
+                                            self.events, self.stop, self.report_interval))
+            process.start()
+            self.processes.append(process)
+        self.start_time = time.perf_counter()
+        return self
+
+    def run(self):
+        """
+        Merge events until every stream has ended or Ctrl+C is pressed. Returns stats().
+        """
+        self.start()
+        last_report = time.perf_counter()
+        try:
+            while not all(stream["done"] for stream in self.streams):
+                try:
+                    self._handle(self.events.get(timeout=0.5))
+                except queue.Empty:
+                    # A worker that died without saying goodbye is finished too
+                    for stream, process in zip(self.streams, self.processes):
+                        if not process.is_alive():
+                            stream["done"] = True
+
+                if time.perf_counter() - last_report >= self.report_interval:
+                    self.report()
+                    last_report = time.perf_counter()
+        except KeyboardInterrupt:
+            print("Stopping streams...")
+        finally:
+            self.close()
+        self.report()
+        return self.stats()
+
+    def _handle(self, event):
+        kind, stream_id = event[:2]
+        stream = self.streams[stream_id]
+        if kind == "gesture":
+            self._merge(stream_id, event[2], event[3])
+        else:
+            stream["frames"], stream["seconds"] = event[2], event[3]
+            if kind == "done":
+                stream["done"] = True
+
+    def _merge(self, stream_id, gesture, event_time):
+        self.streams[stream_id]["gestures"] += 1
+        last = self.last_fired.get(gesture)
+        if last is not None and last[1] != stream_id and abs(event_time - last[0]) < self.merge_window:
+            self.merged += 1
+            return
+        self.last_fired[gesture] = (event_time, stream_id)
+        self.actions += 1
+        if not self.stop.is_set():
+            self.dispatcher.dispatch(gesture)
+
+    def stats(self):
+        """
+        Return per-stream frame rates and the merged action counters.
+        """
+        streams = []
+        for stream in self.streams:
+            fps = stream["frames"] / stream["seconds"] if stream["seconds"] else 0.0
+            streams.append({"source": stream["source"], "frames": stream["frames"], "fps": round(fps, 1),
+                            "gestures": stream["gestures"]})
+        elapsed = (self.end_time or time.perf_counter()) - self.start_time if self.start_time else 0.0
+        total_frames = sum(stream["frames"] for stream in self.streams)
+        return {
+            "streams": streams,
+            "total_fps": round(total_frames / elapsed, 1) if elapsed else 0.0,
+            "actions": self.actions,
+            "merged": self.merged,
+        }
+
+    def report(self):
+        """
+        Print the frame rate of every stream.
+        """
+        stats = self.stats()
+        for stream_id, stream in enumerate(stats["streams"]):
+            print(f"Stream {stream_id} ({stream['source']}): {stream['fps']:.1f} fps, "
+                  f"{stream['frames']} frames, {stream['gestures']} gestures")
+        print(f"All streams: {stats['total_fps']:.1f} fps, {stats['actions']} actions, {stats['merged']} merged")
+
+    def close(self):
+        """
+        Stop the workers, keeping the event queue drained so none of them blocks on exit.
+        """
+        self.stop.set()
+        deadline = time.perf_counter() + 5.0
+        for process in self.processes:
+            while process.is_alive() and time.perf_counter() < deadline:
+                self._drain()
+                process.join(timeout=0.1)
+            if process.is_alive():
+                process.terminate()
+        self._drain()
+        self.end_time = time.perf_counter()
+        if self.dispatcher is not None:
+            self.dispatcher.close()
+            self.dispatcher = None
+
+    def _drain(self):
+        while True:
+            try:
+                self._handle(self.events.get_nowait())
+            except queue.Empty:
+                return
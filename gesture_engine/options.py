@@ -0,0 +1,70 @@
+# Command line options of a GestureSession. This module has no heavy imports
+# so entry scripts can parse their arguments before OpenCV and MediaPipe load.
+
+# Frame preprocessing modes, see FramePreprocessor
+PREPROCESS_MODES = ("copy", "buffers", "mirror")
+
+# Action backends, see gesture_engine.backends.BACKENDS
+BACKEND_NAMES = ("keyboard", "simulated", "recording")
+
+
+def add_session_arguments(parser):
+    """
+    Add the command line options that configure a GestureSession.
+    """
+    parser.add_argument("--record", metavar="PATH", help="save the hand landmark stream to PATH")
+    parser.add_argument("--replay", metavar="PATH", help="replay a saved landmark stream instead of using the camera")
+    parser.add_argument("--realtime", action="store_true", help="replay at the recorded speed instead of as fast as possible")
+    parser.add_argument("--roi", action="store_true", help="run the hand model on a crop around the tracked hand")
+    parser.add_argument("--downscale", type=float, default=1.0, metavar="FACTOR",
+                        help="shrink frames by FACTOR (e.g. 0.5) for full-frame hand detection")
+    parser.add_argument("--min-rate", type=float, metavar="HZ",
+                        help="probe for hands only HZ times per second while nobody is in view")
+    parser.add_argument("--max-rate", type=float, metavar="HZ", help="never run the hand model more than HZ times per second")
+    parser.add_argument("--stable-frames", type=int, default=5, metavar="N",
+                        help="frames out of the voting window a gesture needs before it fires")
+    parser.add_argument("--window-frames", type=int, default=8, metavar="M", help="size of the voting window in frames")
+    parser.add_argument("--combos", action="store_true",
+                        help="also recognize multi-gesture combos in free gesture control")
+    parser.add_argument("--async-inference", action="store_true",
+                        help="run the hand model in a separate process so the control loop never waits for it")
+    parser.add_argument("--preprocess", choices=PREPROCESS_MODES, default="buffers",
+                        help="copy: new images every frame, buffers: reuse preallocated images, "
+                             "mirror: also skip flipping the frame before inference")
+    parser.add_argument("--auto-tune", action="store_true",
+                        help="pick the hand model complexity reaching --target-fps on this machine (cached)")
+    parser.add_argument("--target-fps", type=float, default=24.0, metavar="FPS",
+                        help="frame rate the hand model must sustain for --auto-tune")
+    parser.add_argument("--retune", action="store_true", help="measure again instead of using the cached choice")
+    parser.add_argument("--backend", choices=BACKEND_NAMES, default="keyboard",
+                        help="keyboard: press PowerPoint's keys, simulated/recording: keep actions in memory")
+    parser.add_argument("--profile", action="store_true",
+                        help="time every pipeline stage and print latency percentiles")
+    parser.add_argument("--headless", action="store_true",
+                        help="skip all drawing and the preview window; stop with Ctrl+C")
+
+
+def session_options(args):
+    """
+    Return the GestureSession keyword arguments set by options from add_session_arguments.
+    """
+    return {
+        "record_path": args.record,
+        "replay_path": args.replay,
+        "realtime": args.realtime,
+        "roi_tracking": args.roi,
+        "downscale": args.downscale,
+        "min_rate": args.min_rate,
+        "max_rate": args.max_rate,
+        "headless": args.headless,
+        "stable_frames": args.stable_frames,
+        "window_frames": args.window_frames,
+        "combos": args.combos,
+        "profile": args.profile,
+        "async_inference": args.async_inference,
+        "preprocess": args.preprocess,
+        "auto_tune": args.auto_tune,
+        "target_fps": args.target_fps,
+        "retune": args.retune,
+        "backend": args.backend,
+    }
@@ -0,0 +1,93 @@
+import cv2
+import numpy as np
+from mediapipe.framework.formats import landmark_pb2
+
+from gesture_engine.options import PREPROCESS_MODES
+
+
+class FramePreprocessor:
+    """
+    Mirror and color-convert camera frames for the hand model.
+
+    Modes:
+      copy     cv2.flip and cv2.cvtColor allocate two new images every frame
+      buffers  the same operations write into preallocated dst= buffers
+      mirror   the frame is not flipped before inference at all; the model
+               sees the camera image and, only when a preview is drawn, the
+               frame is flipped into a buffer and the landmarks are mirrored
+               (x becomes 1 - x) to match it
+
+    Classification only compares vertical positions and absolute horizontal
+    distances, so it gives the same result on mirrored and unmirrored
+    landmarks. In mirror mode recorded landmarks are in camera orientation.
+    Every full-size image allocated here is counted.
+    """
+
+    def __init__(self, mode="buffers"):
+        if mode not in PREPROCESS_MODES:
+            raise ValueError(f"Unknown preprocessing mode {mode!r}, expected one of {PREPROCESS_MODES}")
+        self.mode = mode
+        self.flipped = None
+        self.rgb = None
+
+        # Counters
+        self.frames = 0
+        self.allocations = 0
+
+    def _buffer(self, buffer, frame):
+        if buffer is None or buffer.shape != frame.shape:
+            self.allocations += 1
+            return np.empty_like(frame)
+        return buffer
+
+    def mirror(self, frame):
+        """
+        Return the frame as the hand model should see it.
+        """
+        self.frames += 1
+        if self.mode == "copy":
+            self.allocations += 1
+            return cv2.flip(frame, 1)
+        if self.mode == "buffers":
+            self.flipped = self._buffer(self.flipped, frame)
+            return cv2.flip(frame, 1, dst=self.flipped)
+        return frame
+
+    def to_rgb(self, frame):
+        """
+        Convert a BGR frame to the RGB image the hand model expects.
+        """
+        if self.mode == "copy":
+            self.allocations += 1
+            return cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        self.rgb = self._buffer(self.rgb, frame)
+        return cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=self.rgb)
+
+    def display(self, frame):
+        """
+        Return the frame to draw on and show, mirrored like a mirror for the user.
+        """
+        if self.mode != "mirror":
+            return frame
+        self.flipped = self._buffer(self.flipped, frame)
+        return cv2.flip(frame, 1, dst=self.flipped)
+
+    def display_hands(self, hands):
+        """
+        Return the hands in the orientation of the displayed frame.
+        """
+        if self.mode != "mirror" or not hands:
+            return hands
+        mirrored = []
+        for hand_landmarks in hands:
+            hand = landmark_pb2.NormalizedLandmarkList()
+            hand.CopyFrom(hand_landmarks)
+            for lm in hand.landmark:
+                lm.x = 1.0 - lm.x
+            mirrored.append(hand)
+        return mirrored
+
+    def stats(self):
+        per_frame = self.allocations / self.frames if self.frames else 0.0
+        return {"mode": self.mode, "frames": self.frames, "image_allocations": self.allocations,
+                "allocations_per_frame": round(per_frame, 3)}
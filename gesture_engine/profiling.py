@@ -0,0 +1,158 @@
+import math
+import threading
+import time
+
+# Histogram buckets grow by 2 ** (1 / 8), about 9% per bucket, from 1 microsecond up to ~17 minutes
+BUCKET_MIN = 1e-6
+BUCKETS_PER_DOUBLING = 8
+BUCKET_COUNT = 30 * BUCKETS_PER_DOUBLING
+_LOG_RATIO = math.log(2) / BUCKETS_PER_DOUBLING
+
+# Stages in the order a frame goes through them, used to sort reports
+STAGE_ORDER = ("cap.read", "cv2.flip", "cv2.cvtColor", "hands.process", "classify",
+               "execute_action", "render", "end_to_end")
+
+
+class LatencyHistogram:
+    """
+    Log-bucketed latency histogram with constant-time recording.
+    """
+
+    def __init__(self):
+        self.counts = [0] * BUCKET_COUNT
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, seconds):
+        if seconds > BUCKET_MIN:
+            bucket = min(int(math.log(seconds / BUCKET_MIN) / _LOG_RATIO), BUCKET_COUNT - 1)
+        else:
+            bucket = 0
+        self.counts[bucket] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def percentile(self, fraction):
+        """
+        Upper edge of the bucket holding the given fraction of samples, in seconds.
+        """
+        if not self.count:
+            return 0.0
+        target = fraction * self.count
+        seen = 0
+        for bucket, count in enumerate(self.counts):
+            seen += count
+            if seen >= target:
+                return min(BUCKET_MIN * math.exp((bucket + 1) * _LOG_RATIO), self.max)
+        return self.max
+
+    def summary(self):
+        """
+        Return count, mean, p50, p95, p99 and max, times in milliseconds.
+        """
+        mean = self.total / self.count if self.count else 0.0
+        return {
+            "count": self.count,
+            "mean_ms": round(mean * 1000, 3),
+            "p50_ms": round(self.percentile(0.50) * 1000, 3),
+            "p95_ms": round(self.percentile(0.95) * 1000, 3),
+            "p99_ms": round(self.percentile(0.99) * 1000, 3),
+            "max_ms": round(self.max * 1000, 3),
+        }
+
+
+class StageProfiler:
+    """
+    Per-stage latency histograms on the perf_counter monotonic clock.
+
+    Call sites take `start = profiler.now()` before a stage and
+    `profiler.record(stage, start)` after it. Every sample goes into the
+    session totals and into the current run's histograms; reset() starts a
+    new run and keeps the totals. The action dispatcher records from its own
+    thread, so the histograms are guarded by a lock.
+    """
+
+    enabled = True
+
+    def __init__(self):
+        self.stages = {}
+        self.run_stages = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def now():
+        return time.perf_counter()
+
+    def record(self, stage, start):
+        self.record_duration(stage, time.perf_counter() - start)
+
+    def record_duration(self, stage, seconds):
+        with self._lock:
+            for stages in (self.stages, self.run_stages):
+                histogram = stages.get(stage)
+                if histogram is None:
+                    histogram = stages[stage] = LatencyHistogram()
+                histogram.record(seconds)
+
+    def summary(self, run=False):
+        """
+        Return {stage: histogram summary} of the session, or of the current run, stages in pipeline order.
+        """
+        order = {stage: i for i, stage in enumerate(STAGE_ORDER)}
+        with self._lock:
+            stages = self.run_stages if run else self.stages
+            names = sorted(stages, key=lambda stage: (order.get(stage, len(order)), stage))
+            return {stage: stages[stage].summary() for stage in names}
+
+    def report(self, title="Latency summary", run=False):
+        """
+        Print the summary as a table.
+        """
+        summary = self.summary(run)
+        if not summary:
+            return
+        print(f"{title}:")
+        print(f"  {'stage':<16}{'count':>8}{'mean':>10}{'p50':>10}{'p95':>10}{'p99':>10}{'max':>10}  (ms)")
+        for stage, row in summary.items():
+            print(f"  {stage:<16}{row['count']:>8}{row['mean_ms']:>10.2f}{row['p50_ms']:>10.2f}"
+                  f"{row['p95_ms']:>10.2f}{row['p99_ms']:>10.2f}{row['max_ms']:>10.2f}")
+
+    def reset(self):
+        """
+        Start a new run; the session totals are kept.
+        """
+        with self._lock:
+            self.run_stages = {}
+
+
+class NullProfiler:
+    """
+    Profiler stand-in used when instrumentation is off; every call is a no-op.
+    """
+
+    enabled = False
+
+    @staticmethod
+    def now():
+        return 0.0
+
+    def record(self, stage, start):
+        pass
+
+    def record_duration(self, stage, seconds):
+        pass
+
+    def summary(self, run=False):
+        return {}
+
+    def report(self, title="Latency summary", run=False):
+        pass
+
+    def reset(self):
+        pass
+
+
+NULL_PROFILER = NullProfiler()
@@ -0,0 +1,214 @@
+import json
+import time
+
+import numpy as np
+from mediapipe.framework.formats import landmark_pb2
+
+# Size of the blank frames handed out while replaying a landmark recording
+REPLAY_FRAME_SIZE = (480, 640)
+
+RECORDING_FORMAT = "hand-landmarks"
+RECORDING_VERSION = 1
+
+
+class ReplayResults:
+    """
+    Minimal stand-in for the object returned by mediapipe Hands.process.
+    """
+
+    def __init__(self, multi_hand_landmarks):
+        # MediaPipe reports None, not an empty list, when no hand is visible
+        self.multi_hand_landmarks = multi_hand_landmarks or None
+        self.multi_handedness = None
+
+
+def hand_to_list(hand_landmarks):
+    """
+    Convert a NormalizedLandmarkList into a list of [x, y, z] triples.
+    """
+    return [[lm.x, lm.y, lm.z] for lm in hand_landmarks.landmark]
+
+
+def list_to_hand(points):
+    """
+    Convert a list of [x, y, z] triples back into a NormalizedLandmarkList.
+    """
+    return landmark_pb2.NormalizedLandmarkList(
+        landmark=[landmark_pb2.NormalizedLandmark(x=x, y=y, z=z) for x, y, z in points]
+    )
+
+
+class LandmarkRecorder:
+    """
+    Write the MediaPipe landmark stream of a session to a JSON lines file.
+
+    The first line is a header, every following line holds the frame time in
+    seconds since the recording started and the landmarks of each detected hand.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.file = open(path, mode="w")
+        self.file.write(json.dumps({"format": RECORDING_FORMAT, "version": RECORDING_VERSION}) + "\n")
+        self.start_time = time.monotonic()
+        self.frames = 0
+
+    def record(self, results, timestamp=None):
+        """
+        Append one frame worth of hand landmarks.
+        """
+        if timestamp is None:
+            timestamp = time.monotonic()
+        hands = []
+        if results.multi_hand_landmarks:
+            hands = [hand_to_list(hand) for hand in results.multi_hand_landmarks]
+        self.file.write(json.dumps({"t": round(timestamp - self.start_time, 4), "hands": hands}) + "\n")
+        self.frames += 1
+
+    def close(self):
+        if not self.file.closed:
+            self.file.close()
+            print(f"Recorded {self.frames} frames to {self.path}")
+
+
+class RecordingHands:
+    """
+    Wrap a Hands graph and record every result it produces.
+    """
+
+    def __init__(self, hands, recorder):
+        self.hands = hands
+        self.recorder = recorder
+
+    def process(self, frame_rgb):
+        results = self.hands.process(frame_rgb)
+        if results is not None:
+            self.recorder.record(results)
+        return results
+
+    def close(self):
+        self.hands.close()
+        self.recorder.close()
+
+
+def read_recording(path):
+    """
+    Yield (timestamp, hands) tuples from a recording, hands being lists of [x, y, z] triples.
+    """
+    with open(path) as file:
+        header = json.loads(file.readline())
+        if header.get("format") != RECORDING_FORMAT:
+            raise ValueError(f"{path} is not a hand landmark recording")
+        for line in file:
+            if line.strip():
+                entry = json.loads(line)
+                yield entry["t"], entry["hands"]
+
+
+def load_recording(path):
+    """
+    Load a recording into arrays for offline processing.
+
+    Returns (timestamps, landmarks, frame_index) where landmarks is an (N, 21, 3)
+    float32 array with one row per detected hand and frame_index maps each row
+    back to its frame in timestamps.
+    """
+    timestamps = []
+    landmarks = []
+    frame_index = []
+    for i, (timestamp, hands) in enumerate(read_recording(path)):
+        timestamps.append(timestamp)
+        for hand in hands:
+            landmarks.append(hand)
+            frame_index.append(i)
+    landmarks = np.asarray(landmarks, dtype=np.float32).reshape(-1, 21, 3)
+    return np.asarray(timestamps), landmarks, np.asarray(frame_index, dtype=np.int64)
+
+
+class ReplaySource:
+    """
+    Feed a recorded landmark stream back at real-time or maximum speed.
+
+    Iterating yields (timestamp, results) where results looks like the output of
+    Hands.process, so count_fingers and detect_gesture can consume it directly.
+    """
+
+    def __init__(self, path, realtime=False):
+        self.path = path
+        self.realtime = realtime
+        self._frames = read_recording(path)
+        self._start = None
+        self.current = ReplayResults(None)
+        self.current_time = 0.0
+        self.exhausted = False
+        self.frames = 0
+
+    def advance(self):
+        """
+        Move to the next recorded frame. Returns False once the recording is exhausted.
+        """
+        try:
+            timestamp, hands = next(self._frames)
+        except StopIteration:
+            self.exhausted = True
+            self.current = ReplayResults(None)
+            return False
+
+        if self.realtime:
+            if self._start is None:
+                self._start = time.monotonic() - timestamp
+            delay = self._start + timestamp - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+
+        self.current = ReplayResults([list_to_hand(hand) for hand in hands])
+        self.current_time = timestamp
+        self.frames += 1
+        return True
+
+    def __iter__(self):
+        while self.advance():
+            yield self.current_time, self.current
+
+
+class ReplayCapture:
+    """
+    Capture stand-in that advances a ReplaySource and returns a blank frame.
+    """
+
+    def __init__(self, source):
+        self.source = source
+        self.frame = np.zeros(REPLAY_FRAME_SIZE + (3,), dtype=np.uint8)
+
+    def read(self):
+        if not self.source.advance():
+            return False, None
+        return True, self.frame
+
+    def read_with_timestamp(self):
+        success, frame = self.read()
+        return success, frame, time.perf_counter()
+
+    def isOpened(self):
+        return not self.source.exhausted
+
+    def stats(self):
+        return {"replayed": self.source.frames}
+
+    def release(self):
+        self.source.exhausted = True
+
+
+class ReplayHands:
+    """
+    Hands stand-in that returns the landmarks of the current replayed frame.
+    """
+
+    def __init__(self, source):
+        self.source = source
+
+    def process(self, frame_rgb):
+        return self.source.current
+
+    def close(self):
+        pass
@@ -0,0 +1,121 @@
+import json
+import os
+import time
+
+RESULTS_FILE = "logs/user_performance.jsonl"
+
+# Workbook layout used by the analysts: one column pair per flow, grouped by gesture type
+GESTURE_TYPES = ("Specific", "Counting")
+SHEET_TITLE = "List1"
+
+
+class ResultsStore:
+    """
+    Append-only store of participant results, one JSON record per line.
+
+    Every record is written with a single append-mode write and synced to
+    disk, so adding a participant costs the same however many came before,
+    and concurrent runners add whole lines instead of overwriting each other.
+    """
+
+    def __init__(self, path=RESULTS_FILE):
+        self.path = path
+
+    def append(self, user_uuid, results, timestamp=None, **fields):
+        """
+        Store the (elapsed_time, error_count) pairs of one participant. Returns the record.
+
+        timestamp defaults to now; imported results whose session time is
+        unknown pass timestamp=False and are stored with a null timestamp.
+        """
+        if timestamp is None:
+            timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
+        record = {
+            "uuid": str(user_uuid),
+            "timestamp": timestamp or None,
+            "results": [[elapsed_time, error_count] for elapsed_time, error_count in results],
+        }
+        record.update(fields)
+        line = (json.dumps(record) + "\n").encode("utf-8")
+
+        flags = os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_BINARY", 0)
+        fd = os.open(self.path, flags, 0o644)
+        try:
+            os.write(fd, line)
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        return record
+
+    def records(self):
+        """
+        Yield every stored record in the order it was added.
+        """
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, encoding="utf-8") as file:
+            for line in file:
+                if not line.strip():
+                    continue
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    # A run killed mid-write leaves a torn last line
+                    print(f"Skipping unreadable record in {self.path}: {line[:60]!r}")
+
+
+def export_xlsx(records, path, flows_per_type=3):
+    """
+    Write records to an xlsx workbook: UUID, then elapsed time and error count per flow.
+    """
+    import openpyxl
+    from openpyxl.styles import Alignment
+
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.title = SHEET_TITLE
+
+    # Two header rows: the gesture type over its flows, then the column names
+    ws.cell(row=2, column=1, value="User")
+    for type_index, gesture_type in enumerate(GESTURE_TYPES):
+        first_column = 2 + type_index * flows_per_type * 2
+        ws.cell(row=1, column=first_column, value=gesture_type).alignment = Alignment(horizontal="center")
+        ws.merge_cells(start_row=1, start_column=first_column,
+                       end_row=1, end_column=first_column + flows_per_type * 2 - 1)
+        for flow in range(1, flows_per_type + 1):
+            column = first_column + (flow - 1) * 2
+            ws.cell(row=2, column=column, value=f"Flow {flow}")
+            ws.cell(row=2, column=column + 1, value=f" Error number {flow}")
+    ws.column_dimensions["A"].width = 38
+
+    rows = 0
+    for row, record in enumerate(records, start=3):
+        ws.cell(row=row, column=1, value=record["uuid"])
+        for i, (elapsed_time, error_count) in enumerate(record["results"]):
+            ws.cell(row=row, column=2 + i * 2, value=elapsed_time)
+            ws.cell(row=row, column=3 + i * 2, value=error_count)
+        rows += 1
+
+    wb.save(path)
+    return rows
+
+
+def import_xlsx(path, store):
+    """
+    Copy the participants of a workbook in the export layout into a ResultsStore.
+
+    The workbook does not say when its sessions took place, so the records
+    get a null timestamp rather than the time of the import.
+    """
+    import openpyxl
+
+    ws = openpyxl.load_workbook(path, read_only=True).active
+    imported = 0
+    for row in ws.iter_rows(min_row=3, values_only=True):
+        if not row or row[0] is None:
+            continue
+        values = row[1:]
+        results = [(values[i], values[i + 1]) for i in range(0, len(values) - 1, 2) if values[i] is not None]
+        store.append(row[0], results, timestamp=False, source=os.path.basename(path))
+        imported += 1
+    return imported
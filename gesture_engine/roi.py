@@ -0,0 +1,107 @@
+import cv2
+import numpy as np
+
+
+class RoiHands:
+    """
+    Run a Hands graph on a padded crop around the last known hand.
+
+    While a hand is tracked only the region around the previous frame's
+    landmarks is processed, and the landmarks are mapped back to full-frame
+    normalized coordinates so the finger thresholds keep their meaning. When
+    the hand is lost the next frame falls back to full-frame detection, which
+    can itself run on a downscaled copy of the frame. With track=False only the
+    downscaled full-frame path is used.
+
+    Crops go through their own graph, crop_hands, so MediaPipe's tracking
+    state from a crop is never applied to a full frame or the other way
+    round. Both graphs are closed by close().
+    """
+
+    def __init__(self, hands, crop_hands=None, track=True, padding=0.5, downscale=1.0, min_roi_size=96):
+        if track and crop_hands is None:
+            raise ValueError("ROI tracking needs a separate Hands instance for the crops")
+        self.hands = hands
+        self.crop_hands = crop_hands
+        self.track = track
+        self.padding = padding
+        self.downscale = downscale
+        self.min_roi_size = min_roi_size
+        self.roi = None
+
+        # Counters
+        self.roi_frames = 0
+        self.full_frames = 0
+        self.roi_losses = 0
+
+    def process(self, frame_rgb):
+        height, width = frame_rgb.shape[:2]
+
+        if self.roi is not None:
+            x0, y0, x1, y1 = self.roi
+            crop = np.ascontiguousarray(frame_rgb[y0:y1, x0:x1])
+            results = self.crop_hands.process(crop)
+            if results.multi_hand_landmarks:
+                self.roi_frames += 1
+                for hand_landmarks in results.multi_hand_landmarks:
+                    self._to_full_frame(hand_landmarks, x0, y0, x1 - x0, y1 - y0, width, height)
+                self.roi = self._roi_from(results, width, height)
+                return results
+            # Hand left the crop, look at the whole frame again
+            self.roi = None
+            self.roi_losses += 1
+
+        self.full_frames += 1
+        if self.downscale < 1.0:
+            # Normalized landmarks do not depend on the image size, so no remapping is needed
+            small = cv2.resize(frame_rgb, None, fx=self.downscale, fy=self.downscale,
+                               interpolation=cv2.INTER_AREA)
+            results = self.hands.process(small)
+        else:
+            results = self.hands.process(frame_rgb)
+
+        if self.track and results.multi_hand_landmarks:
+            self.roi = self._roi_from(results, width, height)
+        return results
+
+    @staticmethod
+    def _to_full_frame(hand_landmarks, x0, y0, crop_width, crop_height, width, height):
+        for lm in hand_landmarks.landmark:
+            lm.x = (x0 + lm.x * crop_width) / width
+            lm.y = (y0 + lm.y * crop_height) / height
+            # z uses roughly the same scale as x
+            lm.z = lm.z * crop_width / width
+
+    def _roi_from(self, results, width, height):
+        """
+        Square pixel box around all detected landmarks, padded and clipped to the frame.
+        """
+        xs = [lm.x for hand in results.multi_hand_landmarks for lm in hand.landmark]
+        ys = [lm.y for hand in results.multi_hand_landmarks for lm in hand.landmark]
+        center_x = (min(xs) + max(xs)) / 2 * width
+        center_y = (min(ys) + max(ys)) / 2 * height
+        size = max((max(xs) - min(xs)) * width, (max(ys) - min(ys)) * height)
+        size = max(size * (1 + 2 * self.padding), self.min_roi_size)
+
+        x0 = int(max(center_x - size / 2, 0))
+        y0 = int(max(center_y - size / 2, 0))
+        x1 = int(min(center_x + size / 2, width))
+        y1 = int(min(center_y + size / 2, height))
+        if x1 - x0 < 2 or y1 - y0 < 2:
+            return None
+        return x0, y0, x1, y1
+
+    def stats(self):
+        """
+        Return a dictionary with the ROI counters.
+        """
+        return {
+            "roi_frames": self.roi_frames,
+            "full_frames": self.full_frames,
+            "roi_losses": self.roi_losses,
+        }
+
+    def close(self):
+        self.hands.close()
+        if self.crop_hands is not None:
+            self.crop_hands.close()
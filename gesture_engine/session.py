@@ -0,0 +1,329 @@
+import signal
+import threading
+import time
+
+import mediapipe as mp
+import numpy as np
+
+from gesture_engine.autotune import tune_hands_options
+from gesture_engine.backends import get_backend
+from gesture_engine.capture import FileCapture, ThreadedCapture
+from gesture_engine.combos import ComboRecognizer
+from gesture_engine.debounce import GestureDebouncer
+from gesture_engine.dispatch import ActionDispatcher
+from gesture_engine.governor import InferenceGovernor
+from gesture_engine.inference import AsyncHands
+# The option helpers are re-exported so entry scripts can keep importing them from here
+from gesture_engine.options import add_session_arguments, session_options
+from gesture_engine.preprocess import FramePreprocessor
+from gesture_engine.profiling import NULL_PROFILER, StageProfiler
+from gesture_engine.replay import (REPLAY_FRAME_SIZE, LandmarkRecorder, RecordingHands, ReplayCapture,
+                                   ReplayHands, ReplaySource)
+from gesture_engine.roi import RoiHands
+
+mp_hands = mp.solutions.hands
+
+
+class GestureSession:
+    """
+    Long-lived camera and MediaPipe Hands graph shared by several workflow runs.
+
+    Opening the camera and loading the hand model is paid once in open();
+    every later run reuses both and records the startup time it saved.
+
+    camera_index may also be the path of a video file, which is then read
+    frame by frame without dropping any.
+
+    With record_path the landmark stream is saved to a file; with replay_path a
+    saved stream replaces the camera and the model entirely, at recorded speed
+    when realtime is True and as fast as possible otherwise.
+
+    roi_tracking runs the model on a crop around the last seen hand, and
+    downscale shrinks the frame for full-frame detection (see RoiHands).
+    Setting min_rate and/or max_rate attaches an InferenceGovernor that
+    throttles the model while no hand is in view.
+
+    Actions are performed by backend, a name from BACKENDS or an
+    ActionBackend: "keyboard" presses PowerPoint's keys, "simulated" and
+    "recording" keep them in memory. They are handed to an ActionDispatcher
+    worker unless dispatch_actions is False, in which case they are
+    performed inline.
+
+    A gesture fires once it is stable for stable_frames of the last
+    window_frames processed frames (see GestureDebouncer). With combos the
+    live loop also recognizes the classifier's gesture combos (see
+    ComboRecognizer).
+
+    With async_inference the hand model runs in a worker process fed through
+    shared memory (see AsyncHands); the control loop then never waits for it.
+
+    preprocess selects how frames are mirrored and color-converted (see
+    FramePreprocessor): "buffers" reuses preallocated images, "mirror" skips
+    flipping before inference and "copy" allocates new images every frame.
+
+    With auto_tune the hand model complexity and confidences are chosen as
+    the most accurate setting reaching target_fps on this machine, measured
+    on the first run and cached per machine afterwards (retune measures again).
+
+    warm_up runs the hand model once on a blank frame while opening, so the
+    first real frame does not pay for its initialization. A StartupTimer
+    passed as startup_timer gets the time of the first classified frame.
+
+    With profile=True every pipeline stage is timed into latency histograms
+    (see StageProfiler); otherwise a no-op profiler is used.
+
+    In headless mode nothing is drawn or shown; Ctrl+C (SIGINT) or SIGTERM
+    ask the control loop to stop instead of the Q key in the preview window.
+    Like Q, they end the current workflow run and the next run starts normally.
+    """
+
+    def __init__(self, camera_index=0, model_complexity=1, max_num_hands=1,
+                 min_detection_confidence=0.5, min_tracking_confidence=0.5,
+                 record_path=None, replay_path=None, realtime=False, roi_tracking=False, downscale=1.0,
+                 min_rate=None, max_rate=None, dispatch_actions=True,
+                 headless=False, stable_frames=5, window_frames=8, profile=False, async_inference=False,
+                 preprocess="buffers", auto_tune=False, target_fps=24.0, retune=False,
+                 warm_up=False, startup_timer=None, backend="keyboard", combos=False):
+        self.camera_index = camera_index
+        self.record_path = record_path
+        self.replay_path = replay_path
+        self.realtime = realtime
+        self.roi_tracking = roi_tracking
+        self.downscale = downscale
+        self.roi_hands = None
+        self.async_inference = async_inference
+        self.async_hands = None
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.governor = None
+        self.dispatch_actions = dispatch_actions
+        self.dispatcher = None
+        self.backend = get_backend(backend)
+        self.headless = headless
+        self.stable_frames = stable_frames
+        self.window_frames = window_frames
+        self.combos = combos
+        self.profiler = StageProfiler() if profile else NULL_PROFILER
+        self.preprocessor = FramePreprocessor(preprocess)
+        self.auto_tune = auto_tune
+        self.target_fps = target_fps
+        self.retune = retune
+        self.warm_up = warm_up
+        self.startup_timer = startup_timer
+        self.first_classified = None
+        self._stop = threading.Event()
+        self._previous_handlers = {}
+        self.render_seconds = 0.0
+        self.rendered_frames = 0
+        self.hands_options = {
+            "model_complexity": model_complexity,
+            "max_num_hands": max_num_hands,
+            "min_detection_confidence": min_detection_confidence,
+            "min_tracking_confidence": min_tracking_confidence,
+        }
+        self.cap = None
+        self.hands = None
+        self.replay_source = None
+        self.startup_seconds = 0.0
+        self.runs = 0
+
+    def open(self):
+        """
+        Open the camera and build the Hands graph, timing how long it takes.
+        """
+        if self.cap is not None:
+            return self
+
+        start = time.perf_counter()
+        if self.replay_path:
+            self.replay_source = ReplaySource(self.replay_path, realtime=self.realtime)
+            self.cap = ReplayCapture(self.replay_source)
+            self.hands = ReplayHands(self.replay_source)
+        else:
+            if isinstance(self.camera_index, str):
+                self.cap = FileCapture(self.camera_index)
+            else:
+                self.cap = ThreadedCapture(self.camera_index).start()
+            if self.auto_tune:
+                self.hands_options.update(tune_hands_options(self.cap, self.target_fps,
+                                                             self.hands_options["max_num_hands"],
+                                                             retune=self.retune))
+            roi_options = None
+            if self.roi_tracking or self.downscale < 1.0:
+                roi_options = {"track": self.roi_tracking, "downscale": self.downscale}
+            if self.async_inference:
+                self.hands = self.async_hands = AsyncHands(self.hands_options, roi_options)
+            else:
+                self.hands = mp_hands.Hands(**self.hands_options)
+                if self.warm_up:
+                    # Initialize TensorFlow Lite on a blank frame now instead of on the first real one
+                    self.hands.process(np.zeros(REPLAY_FRAME_SIZE + (3,), dtype=np.uint8))
+                if roi_options is not None:
+                    crop_hands = mp_hands.Hands(**self.hands_options) if self.roi_tracking else None
+                    self.hands = self.roi_hands = RoiHands(self.hands, crop_hands, **roi_options)
+            if self.record_path:
+                self.hands = RecordingHands(self.hands, LandmarkRecorder(self.record_path))
+        if self.min_rate or self.max_rate:
+            self.governor = InferenceGovernor(min_rate=self.min_rate or 2.0, max_rate=self.max_rate)
+        if self.dispatch_actions:
+            self.dispatcher = ActionDispatcher(self.backend.perform, profiler=self.profiler).start()
+        if self.headless:
+            self._install_stop_handlers()
+        self.startup_seconds = time.perf_counter() - start
+        print(f"Session opened in {self.startup_seconds:.2f} seconds.")
+        return self
+
+    def begin_run(self):
+        """
+        Mark the start of a workflow run and report the startup time saved by reuse.
+
+        A stop requested during the previous run only ended that run, like Q
+        in the preview window, so it is cleared here.
+        """
+        self.open()
+        if self.headless:
+            self._install_stop_handlers()
+        self._stop.clear()
+        self.runs += 1
+        if self.runs > 1:
+            print(f"Reusing camera and MediaPipe session (saved {self.startup_seconds:.2f} seconds of startup).")
+
+    def _install_stop_handlers(self):
+        # Signal handlers can only be set from the main thread; a session opened
+        # by a warm-up thread gets them when its first run begins
+        if threading.current_thread() is not threading.main_thread() or self._previous_handlers:
+            return
+        for signal_number in (signal.SIGINT, signal.SIGTERM):
+            self._previous_handlers[signal_number] = signal.signal(signal_number, self._request_stop)
+
+    def _request_stop(self, signal_number, stack_frame):
+        print("Stop requested, finishing the current frame.")
+        self._stop.set()
+
+    def stop_requested(self):
+        """
+        Tell whether a headless stop signal has been received.
+        """
+        return self._stop.is_set()
+
+    def record_render(self, seconds):
+        """
+        Add the time spent drawing and showing one frame.
+        """
+        self.render_seconds += seconds
+        self.rendered_frames += 1
+
+    def render_stats(self):
+        """
+        Average per-frame rendering cost, which is what headless mode saves.
+        """
+        mean = self.render_seconds / self.rendered_frames if self.rendered_frames else 0.0
+        return {"rendered_frames": self.rendered_frames, "mean_render_ms": round(mean * 1000, 2)}
+
+    def mark_first_classified(self):
+        """
+        Note the time the first frame was classified, the end of startup.
+        """
+        if self.first_classified is None:
+            self.first_classified = time.perf_counter()
+            if self.startup_timer is not None:
+                self.startup_timer.mark("first classified frame")
+
+    def debouncer(self, classifier):
+        """
+        Build a debouncer for one control loop, honouring the classifier's per-gesture frame counts.
+        """
+        per_action = {gesture: min(frames, self.window_frames)
+                      for gesture, frames in classifier.required_frames.items()}
+        return GestureDebouncer(required=self.stable_frames, window=self.window_frames, per_action=per_action)
+
+    def combo_recognizer(self, classifier):
+        """
+        Build a combo recognizer for one control loop, or None when combos are off or the classifier has none.
+        """
+        if not self.combos or not classifier.combos:
+            return None
+        return ComboRecognizer(classifier.combos)
+
+    def dispatch(self, action, origin_time=None):
+        """
+        Perform the action of a recognized gesture, through the dispatcher when there is one.
+
+        origin_time is the perf_counter capture time of the frame that triggered it.
+        """
+        if self.dispatcher is not None:
+            self.dispatcher.dispatch(action, origin_time)
+        else:
+            start = self.profiler.now()
+            self.backend.perform([action])
+            self.profiler.record("execute_action", start)
+            if origin_time is not None:
+                self.profiler.record("end_to_end", origin_time)
+
+    def clock(self):
+        """
+        Current time in seconds, following the recorded frame times while replaying.
+
+        Live sessions use the monotonic perf_counter clock; only differences
+        between clock() readings are meaningful.
+        """
+        if self.replay_source is not None:
+            return self.replay_source.current_time
+        return time.perf_counter()
+
+    def saved_seconds(self):
+        """
+        Total startup time saved across all runs compared to reopening per run.
+        """
+        return self.startup_seconds * max(self.runs - 1, 0)
+
+    def close(self):
+        """
+        Release the camera and the Hands graph.
+        """
+        if self.dispatcher is not None:
+            self.dispatcher.close()
+            print(f"Dispatch stats: {self.dispatcher.stats()}")
+            self.dispatcher = None
+        if self.hands is not None:
+            self.hands.close()
+            self.hands = None
+        if self.async_hands is not None:
+            print(f"Inference worker stats: {self.async_hands.stats()}")
+            self.async_hands = None
+        if self.governor is not None:
+            print(f"Governor stats: {self.governor.stats()}")
+            self.governor = None
+        if self.roi_hands is not None:
+            print(f"ROI stats: {self.roi_hands.stats()}")
+            self.roi_hands = None
+        if self.cap is not None:
+            self.cap.release()
+            print(f"Capture stats: {self.cap.stats()}")
+            self.cap = None
+        backend_stats = self.backend.stats()
+        if backend_stats:
+            print(f"{self.backend.name.capitalize()} backend stats: {backend_stats}")
+        if self.preprocessor.frames:
+            print(f"Preprocess stats: {self.preprocessor.stats()}")
+        self.profiler.report("Session latency summary")
+        if self.rendered_frames:
+            print(f"Render stats (saved per frame by --headless): {self.render_stats()}")
+        for signal_number, handler in self._previous_handlers.items():
+            signal.signal(signal_number, handler)
+        self._previous_handlers = {}
+        if self.runs > 1:
+            print(f"Session served {self.runs} runs, saving {self.saved_seconds():.2f} seconds of startup.")
+
+    def __enter__(self):
+        return self.open()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def session_from_args(args):
+    """
+    Build a GestureSession from options added by add_session_arguments.
+    """
+    return GestureSession(**session_options(args))
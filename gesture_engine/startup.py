@@ -0,0 +1,93 @@
+import importlib
+import threading
+import time
+
+# Taken when this module is first imported, as early as entry scripts can make it
+PROCESS_ORIGIN = time.perf_counter()
+
+
+class StartupTimer:
+    """
+    Record how long each startup phase and heavy import takes, relative to an origin.
+
+    Phases may be recorded from several threads; each one keeps its duration
+    and the time at which it finished since the origin.
+    """
+
+    def __init__(self, origin=PROCESS_ORIGIN):
+        self.origin = origin
+        self.phases = []
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def now():
+        return time.perf_counter()
+
+    def record(self, label, start):
+        end = time.perf_counter()
+        with self._lock:
+            self.phases.append((label, end - start, end - self.origin))
+
+    def timed_import(self, name):
+        """
+        Import a module by name, recording how long it took unless it was already loaded.
+        """
+        start = time.perf_counter()
+        module = importlib.import_module(name)
+        self.record(f"import {name}", start)
+        return module
+
+    def mark(self, label):
+        """
+        Record a point in time, such as the first classified frame.
+        """
+        self.record(label, time.perf_counter())
+
+    def summary(self):
+        """
+        Return {phase: {"seconds": duration, "at": seconds since the origin}}.
+        """
+        with self._lock:
+            return {label: {"seconds": round(seconds, 4), "at": round(at, 4)} for label, seconds, at in self.phases}
+
+    def report(self, title="Startup breakdown"):
+        print(f"{title}:")
+        print(f"  {'phase':<40}{'seconds':>10}{'at':>10}")
+        with self._lock:
+            for label, seconds, at in sorted(self.phases, key=lambda phase: phase[2]):
+                print(f"  {label:<40}{seconds:>10.3f}{at:>10.3f}")
+
+
+class BackgroundTask:
+    """
+    Run a function on a daemon thread and collect its result, or its exception, later.
+    """
+
+    def __init__(self, function, *args, name="BackgroundTask"):
+        self._function = function
+        self._args = args
+        self._result = None
+        self._error = None
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def _run(self):
+        try:
+            self._result = self._function(*self._args)
+        except BaseException as error:
+            self._error = error
+
+    def done(self):
+        return not self._thread.is_alive()
+
+    def result(self):
+        """
+        Wait for the task and return its result, raising its exception if it failed.
+        """
+        self._thread.join()
+        if self._error is not None:
+            raise self._error
+        return self._result
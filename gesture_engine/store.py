@@ -0,0 +1,196 @@
+import json
+import sqlite3
+import time
+from collections import Counter
+
+SESSIONS_DB = "logs/sessions.db"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS participants (
+    id INTEGER PRIMARY KEY,
+    uuid TEXT NOT NULL UNIQUE,
+    created_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS workflow_runs (
+    id INTEGER PRIMARY KEY,
+    participant_id INTEGER NOT NULL REFERENCES participants(id),
+    gesture_type TEXT NOT NULL,
+    flow_number INTEGER NOT NULL,
+    workflow TEXT NOT NULL,
+    elapsed_seconds REAL NOT NULL,
+    error_count INTEGER NOT NULL,
+    finished_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS error_events (
+    id INTEGER PRIMARY KEY,
+    run_id INTEGER NOT NULL REFERENCES workflow_runs(id),
+    gesture_type TEXT NOT NULL,
+    step INTEGER NOT NULL,
+    expected TEXT NOT NULL,
+    detected TEXT NOT NULL,
+    logged_at TEXT NOT NULL
+);
+"""
+
+# Created once MIGRATIONS have run, so they may use the columns those add. error_events
+# repeats its run's gesture_type so the error rate query can filter, group
+# and count per pair from error_events_type_pair alone.
+INDEXES = """
+DROP INDEX IF EXISTS error_events_pair;
+CREATE INDEX IF NOT EXISTS workflow_runs_participant ON workflow_runs(participant_id);
+CREATE INDEX IF NOT EXISTS workflow_runs_type_flow ON workflow_runs(gesture_type, flow_number);
+CREATE INDEX IF NOT EXISTS error_events_run ON error_events(run_id);
+CREATE INDEX IF NOT EXISTS error_events_type_pair ON error_events(gesture_type, expected, detected, run_id);
+"""
+
+# (table, column, definition, statement filling the column in existing rows)
+MIGRATIONS = [
+    ("error_events", "gesture_type", "TEXT NOT NULL DEFAULT ''",
+     "UPDATE error_events SET gesture_type = (SELECT gesture_type FROM workflow_runs WHERE id = run_id)"),
+]
+
+
+class RunErrors:
+    """
+    Error logger for run_workflow that keeps the errors of one run for the store.
+
+    Every error is also passed on to forward (for example engine.log_error).
+    """
+
+    def __init__(self, forward=None):
+        self.forward = forward
+        self.events = []
+
+    def __call__(self, step, expected, detected, flow_number, gesture_type):
+        self.events.append((step, expected, detected, time.strftime("%Y-%m-%d %H:%M:%S")))
+        if self.forward is not None:
+            self.forward(step, expected, detected, flow_number, gesture_type)
+
+    def flush(self):
+        if hasattr(self.forward, "flush"):
+            self.forward.flush()
+
+
+class SessionStore:
+    """
+    SQLite store of participants, their workflow runs and every error event.
+
+    Unlike error_log.csv, which each run of demo_workflow_main truncates,
+    the store keeps the whole history. Indexes cover the per-participant,
+    per-flow and per-gesture-pair aggregates; stores written by older
+    versions are migrated when opened.
+    """
+
+    def __init__(self, path=SESSIONS_DB):
+        self.path = path
+        self.connection = sqlite3.connect(path)
+        # Write-ahead logging lets analysts query while a session is being recorded
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA foreign_keys=ON")
+        self.connection.executescript(SCHEMA)
+        self._migrate()
+        self.connection.executescript(INDEXES)
+
+    def _migrate(self):
+        """
+        Add the columns that stores created by older versions lack.
+        """
+        with self.connection:
+            for table, column, definition, fill in MIGRATIONS:
+                columns = [row[1] for row in self.connection.execute(f"PRAGMA table_info({table})")]
+                if column not in columns:
+                    self.connection.execute(f"ALTER TABLE {table} ADD COLUMN {column} {definition}")
+                    self.connection.execute(fill)
+
+    def participant_id(self, user_uuid):
+        """
+        Return the id of a participant, adding them on first use.
+        """
+        with self.connection:
+            self.connection.execute("INSERT OR IGNORE INTO participants (uuid, created_at) VALUES (?, ?)",
+                                    (str(user_uuid), time.strftime("%Y-%m-%d %H:%M:%S")))
+        return self.connection.execute("SELECT id FROM participants WHERE uuid = ?", (str(user_uuid),)).fetchone()[0]
+
+    def add_run(self, user_uuid, gesture_type, flow_number, workflow, elapsed_time, errors):
+        """
+        Store one workflow run and its (step, expected, detected, logged_at) error events in one transaction.
+        """
+        participant_id = self.participant_id(user_uuid)
+        with self.connection:
+            cursor = self.connection.execute(
+                "INSERT INTO workflow_runs (participant_id, gesture_type, flow_number, workflow, elapsed_seconds,"
+                " error_count, finished_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (participant_id, gesture_type, flow_number, json.dumps(list(workflow)), elapsed_time, len(errors),
+                 time.strftime("%Y-%m-%d %H:%M:%S")))
+            run_id = cursor.lastrowid
+            self.connection.executemany(
+                "INSERT INTO error_events (run_id, gesture_type, step, expected, detected, logged_at)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                [(run_id, gesture_type) + tuple(event) for event in errors])
+        return run_id
+
+    def expected_counts(self, gesture_type=None):
+        """
+        Return {(gesture_type, gesture): times it was an expected workflow step}.
+
+        Runs share a handful of distinct workflows, so they are counted per
+        distinct workflow rather than per run.
+        """
+        query = "SELECT gesture_type, workflow, COUNT(*) FROM workflow_runs"
+        parameters = ()
+        if gesture_type is not None:
+            query += " WHERE gesture_type = ?"
+            parameters = (gesture_type,)
+        counts = Counter()
+        for run_type, workflow, runs in self.connection.execute(query + " GROUP BY gesture_type, workflow",
+                                                                 parameters):
+            for gesture in json.loads(workflow):
+                counts[run_type, gesture] += runs
+        return counts
+
+    def error_rates(self, gesture_type=None):
+        """
+        Return error counts per (gesture_type, expected, detected) pair, most frequent first.
+
+        Each row is a dict that also holds the number of steps expecting that
+        gesture and the pair's errors per such step.
+        """
+        query = ("SELECT e.gesture_type, e.expected, e.detected, COUNT(*) AS errors,"
+                 " COUNT(DISTINCT r.participant_id) AS participants"
+                 " FROM error_events e JOIN workflow_runs r ON r.id = e.run_id")
+        parameters = ()
+        if gesture_type is not None:
+            query += " WHERE e.gesture_type = ?"
+            parameters = (gesture_type,)
+        query += " GROUP BY e.gesture_type, e.expected, e.detected ORDER BY errors DESC"
+
+        expected = self.expected_counts(gesture_type)
+        rows = []
+        for run_type, expected_gesture, detected, errors, participants in self.connection.execute(query, parameters):
+            attempts = expected[run_type, expected_gesture]
+            rows.append({
+                "gesture_type": run_type,
+                "expected": expected_gesture,
+                "detected": detected,
+                "errors": errors,
+                "participants": participants,
+                "steps": attempts,
+                "error_rate": errors / attempts if attempts else None,
+            })
+        return rows
+
+    def totals(self):
+        """
+        Return the number of participants, workflow runs and error events.
+        """
+        return {table: self.connection.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+                for table in ("participants", "workflow_runs", "error_events")}
+
+    def close(self):
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -0,0 +1,229 @@
+import json
+import os
+import re
+
+from gesture_engine.gestures import GESTURE_IDS, GESTURES
+
+WORKFLOWS_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                              "workflows", "workflows.json")
+
+# Transition to no state: the gesture does not continue the workflow here
+DEAD = -1
+
+# NAME, NAME|NAME, optionally followed by ? (optional), {n} or {m,n} (repeated)
+STEP_PATTERN = re.compile(r"^([A-Z_|]+?)(\?|\{(\d+)(?:,(\d+))?\})?$")
+
+
+def parse_step(step):
+    """
+    Turn a step like "QUESTION_BLOCK{2}" into (gesture ids, min repeats, max repeats).
+    """
+    match = STEP_PATTERN.match(step.replace(" ", ""))
+    if match is None:
+        raise ValueError(f"Invalid workflow step {step!r}")
+    names, suffix, low, high = match.groups()
+    ids = []
+    for name in names.split("|"):
+        if name not in GESTURE_IDS:
+            raise ValueError(f"Unknown gesture {name!r} in workflow step {step!r}")
+        ids.append(GESTURE_IDS[name])
+
+    if suffix is None:
+        return tuple(ids), 1, 1
+    if suffix == "?":
+        return tuple(ids), 0, 1
+    low = int(low)
+    high = int(high) if high is not None else low
+    if high < low or high == 0:
+        raise ValueError(f"Invalid repeat count in workflow step {step!r}")
+    return tuple(ids), low, high
+
+
+class CompiledWorkflow:
+    """
+    Workflow definition compiled into a DFA over integer gesture ids.
+
+    Steps are gesture names, optionally written as alternatives
+    ("PLAY_VIDEO|NEXT_SLIDE"), optional ("NEXT_SLIDE?") or repeated
+    ("QUESTION_BLOCK{2}", "NEXT_SLIDE{1,3}"). The steps are expanded into a
+    sequence of positions and turned into a DFA by subset construction;
+    table[state][gesture_id] is the next state or DEAD, so matching a
+    gesture is one list lookup.
+
+    A run ends as soon as the workflow is complete, so definitions that
+    could still continue once complete (a trailing optional or {m,n} step)
+    are rejected: those gestures could never be performed.
+
+    Iterating a compiled workflow yields its canonical steps: the first
+    alternative of every required step, repeated as often as required. That
+    is what the workflow's "expected" steps are for logging and storage.
+    """
+
+    def __init__(self, definition, name=None):
+        self.definition = list(definition)
+        self.name = name or " -> ".join(self.definition)
+        if not self.definition:
+            raise ValueError("A workflow needs at least one step")
+        items = [parse_step(step) for step in self.definition]
+
+        self.steps = [GESTURES[ids[0]] for ids, low, _ in items for _ in range(low)]
+        # One position per possible repetition; those past the minimum may be skipped
+        positions = [(frozenset(ids), repeat >= low) for ids, low, high in items for repeat in range(high)]
+        self._compile(positions)
+
+    def _compile(self, positions):
+        def closure(indices):
+            closed = set(indices)
+            pending = list(indices)
+            while pending:
+                index = pending.pop()
+                if index < len(positions) and positions[index][1] and index + 1 not in closed:
+                    closed.add(index + 1)
+                    pending.append(index + 1)
+            return frozenset(closed)
+
+        start = closure({0})
+        state_ids = {start: 0}
+        subsets = [start]
+        self.table = []
+        for subset in subsets:
+            row = [DEAD] * len(GESTURES)
+            for gesture_id in range(len(GESTURES)):
+                moved = {index + 1 for index in subset
+                         if index < len(positions) and gesture_id in positions[index][0]}
+                if not moved:
+                    continue
+                target = closure(moved)
+                if target not in state_ids:
+                    state_ids[target] = len(subsets)
+                    subsets.append(target)
+                row[gesture_id] = state_ids[target]
+            self.table.append(row)
+
+        self.start = 0
+        self.accepting = [len(positions) in subset for subset in subsets]
+        for accepting, row in zip(self.accepting, self.table):
+            if accepting and any(target != DEAD for target in row):
+                raise ValueError(f"Workflow {self.name!r} can continue after it is complete, so its "
+                                 f"optional or {{m,n}} steps at the end could never be performed")
+        self.expected = ["|".join(GESTURES[gesture_id] for gesture_id, target in enumerate(row) if target != DEAD)
+                         for row in self.table]
+
+    def step(self, state, gesture_id):
+        """
+        Return the state after gesture_id, or DEAD when it does not continue the workflow.
+        """
+        return self.table[state][gesture_id]
+
+    def matches(self, gestures):
+        """
+        Tell whether a sequence of gesture names is exactly one run through the workflow.
+        """
+        state = self.start
+        for gesture in gestures:
+            state = self.table[state][GESTURE_IDS[gesture]]
+            if state == DEAD:
+                return False
+        return self.accepting[state]
+
+    def __iter__(self):
+        return iter(self.steps)
+
+    def __len__(self):
+        return len(self.steps)
+
+    def __getitem__(self, index):
+        return self.steps[index]
+
+    def __repr__(self):
+        return f"CompiledWorkflow({self.definition!r})"
+
+
+def compile_workflow(workflow):
+    """
+    Return a CompiledWorkflow for a list of steps, or the workflow itself when already compiled.
+    """
+    if isinstance(workflow, CompiledWorkflow):
+        return workflow
+    return CompiledWorkflow(workflow)
+
+
+class WorkflowSet:
+    """
+    Match one gesture stream against many compiled workflows at once.
+
+    The set's state is the tuple of every workflow's DFA state. Such tuples
+    are numbered and their transitions computed the first time they are
+    needed (a lazily built product automaton), so after warming up each
+    gesture costs one list lookup however many workflows are loaded.
+
+    With strict=True a workflow drops out (DEAD) at its first wrong gesture,
+    so completed() names the workflows the stream followed exactly. With
+    strict=False wrong gestures are skipped like errors in run_workflow,
+    and a workflow completes once its steps occurred in order.
+    """
+
+    def __init__(self, workflows, strict=True):
+        self.workflows = [compile_workflow(workflow) for workflow in workflows]
+        self.strict = strict
+        self._states = []
+        self._state_ids = {}
+        self._transitions = []
+        self._completed = []
+        self.state = self._intern(tuple(workflow.start for workflow in self.workflows))
+
+        # Counters
+        self.gestures = 0
+
+    def _intern(self, states):
+        state_id = self._state_ids.get(states)
+        if state_id is None:
+            state_id = len(self._states)
+            self._state_ids[states] = state_id
+            self._states.append(states)
+            self._transitions.append([None] * len(GESTURES))
+            self._completed.append(tuple(index for index, (workflow, state) in enumerate(zip(self.workflows, states))
+                                         if state != DEAD and workflow.accepting[state]))
+        return state_id
+
+    def _advance(self, state_id, gesture_id):
+        states = []
+        for workflow, state in zip(self.workflows, self._states[state_id]):
+            target = DEAD if state == DEAD else workflow.table[state][gesture_id]
+            if target == DEAD and not self.strict:
+                target = state
+            states.append(target)
+        target_id = self._intern(tuple(states))
+        self._transitions[state_id][gesture_id] = target_id
+        return target_id
+
+    def feed(self, gesture_id):
+        """
+        Advance every workflow by one gesture id. Returns the indices of the completed workflows.
+        """
+        self.gestures += 1
+        target = self._transitions[self.state][gesture_id]
+        if target is None:
+            target = self._advance(self.state, gesture_id)
+        self.state = target
+        return self._completed[target]
+
+    def completed(self):
+        return self._completed[self.state]
+
+    def reset(self):
+        self.state = 0
+
+    def stats(self):
+        return {"workflows": len(self.workflows), "gestures": self.gestures, "product_states": len(self._states)}
+
+
+def load_workflows(gesture_type, path=WORKFLOWS_FILE):
+    """
+    Load and compile one set of workflows ("specific", "counting", "working_specific", ...) from the data file.
+    """
+    with open(path) as file:
+        data = json.load(file)
+    if gesture_type not in data["workflows"]:
+        raise ValueError(f"No workflows for gesture type {gesture_type!r} in {path}")
+    return [CompiledWorkflow(steps) for steps in data["workflows"][gesture_type]]
@@ -0,0 +1,52 @@
+import argparse
+import os
+import sys
+
+# Make the shared gesture_engine package importable when run as a script
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gesture_engine.backends import get_backend
+from gesture_engine.classifiers import CLASSIFIERS
+from gesture_engine.multistream import StreamCoordinator
+from gesture_engine.session import add_session_arguments, session_options
+
+def print_actions(actions):
+    """
+    Print actions instead of pressing their keys.
+    """
+    for action in actions:
+        print(f"Action: {action}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Control the presentation from several cameras or recorded streams at once.")
+    parser.add_argument("sources", nargs="+",
+                        help="camera indices, landmark recordings (.jsonl) or video files, one worker process each")
+    parser.add_argument("--classifier", default="specific", help=f"one of {', '.join(CLASSIFIERS)} or a layout file")
+    parser.add_argument("--merge-window", type=float, default=0.5, metavar="SECONDS",
+                        help="merge the same gesture seen by several streams within SECONDS (0 keeps all)")
+    parser.add_argument("--report-interval", type=float, default=5.0, metavar="SECONDS",
+                        help="how often to print per-stream frame rates")
+    parser.add_argument("--dry-run", action="store_true", help="print merged actions instead of pressing keys")
+    add_session_arguments(parser)
+    args = parser.parse_args()
+
+    # Every worker builds its own session; recording, replay and windows are per stream decisions
+    options = session_options(args)
+    for option in ("record_path", "replay_path", "realtime", "headless"):
+        options.pop(option)
+
+    # Merged actions are performed here, by the --backend chosen, not by the workers
+    options.pop("backend")
+    backend = get_backend(args.backend)
+
+    coordinator = StreamCoordinator(args.sources, classifier=args.classifier, session_options=options,
+                                    perform=print_actions if args.dry_run else backend.perform,
+                                    merge_window=args.merge_window, report_interval=args.report_interval)
+    coordinator.run()
+
+    backend_stats = backend.stats()
+    if backend_stats and not args.dry_run:
+        print(f"{backend.name.capitalize()} backend stats: {backend_stats}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,29 @@
+import os
+import sys
+
+import pytest
+
+# Make the shared gesture_engine package importable when run from anywhere
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# The fixtures build MediaPipe landmark messages with numpy
+pytest.importorskip("numpy")
+pytest.importorskip("mediapipe")
+
+from benchmarks.fixtures import synthetic_workflows, workflow_gestures
+from benchmarks.run_benchmarks import benchmark_workflow_matching
+from gesture_engine.workflows import CompiledWorkflow, load_workflows
+
+
+def test_synthetic_workflows_compile():
+    gestures = workflow_gestures(load_workflows("specific"))
+    for steps in synthetic_workflows(gestures, 200):
+        CompiledWorkflow(steps)
+        assert "?" not in steps[-1] and "{" not in steps[-1]
+
+
+def test_benchmark_workflow_matching_on_generated_workflows():
+    workflows = load_workflows("specific")
+    result = benchmark_workflow_matching(workflows, (0, 100), repeat=1)
+    assert list(result) == ["3", "103"]
+    assert all(entry["gestures_per_second"] > 0 for entry in result.values())
@@ -0,0 +1,56 @@
+import os
+import sys
+
+# Make the shared gesture_engine package importable when run from anywhere
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gesture_engine.combos import ComboRecognizer
+from gesture_engine.debounce import GestureDebouncer
+from gesture_engine.gestures import GESTURE_IDS
+
+FPS = 30.0
+COMBOS = [
+    {"gestures": ["NEXT_SLIDE", "NEXT_SLIDE", "NEXT_SLIDE"], "action": "LAST_SLIDE", "window": 2.5},
+    {"gestures": ["NEXT_SLIDE", "PREVIOUS_SLIDE"], "action": "FIRST_SLIDE", "window": 1.0},
+]
+
+
+def run_live_frames(frames, combos=COMBOS):
+    """
+    Feed per-frame labels through the debouncer and the recognizer the way run_live does.
+    """
+    debouncer = GestureDebouncer(required=5, window=8)
+    recognizer = ComboRecognizer(combos)
+    actions = []
+    for index, gesture in enumerate(frames):
+        fired = debouncer.update(gesture)
+        if fired is not None:
+            actions.append(fired)
+            combo = recognizer.update(GESTURE_IDS[fired], index / FPS)
+            if combo is not None:
+                actions.append(combo)
+    return actions
+
+
+def test_held_gesture_with_short_dropouts_is_not_a_combo():
+    frames = (["NEXT_SLIDE"] * 5 + ["UNKNOWN"] * 3) * 3
+    assert run_live_frames(frames) == ["NEXT_SLIDE"]
+
+
+def test_released_repeats_fire_the_combo():
+    frames = (["NEXT_SLIDE"] * 6 + ["UNKNOWN"] * 9) * 3
+    assert run_live_frames(frames) == ["NEXT_SLIDE", "NEXT_SLIDE", "NEXT_SLIDE", "LAST_SLIDE"]
+
+
+def test_combo_outside_its_window_does_not_fire():
+    frames = ["NEXT_SLIDE"] * 6 + ["UNKNOWN"] * 40 + ["PREVIOUS_SLIDE"] * 6
+    assert run_live_frames(frames) == ["NEXT_SLIDE", "PREVIOUS_SLIDE"]
+
+
+def test_longest_combo_wins_and_gestures_are_consumed():
+    recognizer = ComboRecognizer(COMBOS + [{"gestures": ["NEXT_SLIDE", "NEXT_SLIDE"], "action": "PLAY_VIDEO"}])
+    next_slide = GESTURE_IDS["NEXT_SLIDE"]
+    assert recognizer.update(next_slide, 0.0) is None
+    assert recognizer.update(next_slide, 0.5) == "PLAY_VIDEO"
+    assert recognizer.update(next_slide, 1.0) is None
+    assert recognizer.stats() == {"gestures": 3, "combos": 1}
@@ -0,0 +1,97 @@
+import os
+import sys
+
+import pytest
+
+# Make the shared gesture_engine package importable when run from anywhere
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gesture_engine.gestures import GESTURE_IDS
+from gesture_engine.workflows import DEAD, CompiledWorkflow, WorkflowSet, load_workflows, parse_step
+
+
+@pytest.mark.parametrize("step", ["", "next_slide", "NEXT_SLIDE{", "NEXT_SLIDE{2,1}", "NEXT_SLIDE{0}",
+                                  "NEXT_SLIDE??", "NEXT_SLIDE|", "NOT_A_GESTURE"])
+def test_invalid_steps_are_rejected(step):
+    with pytest.raises(ValueError):
+        parse_step(step)
+
+
+def test_parse_step():
+    next_slide, play_video = GESTURE_IDS["NEXT_SLIDE"], GESTURE_IDS["PLAY_VIDEO"]
+    assert parse_step("NEXT_SLIDE") == ((next_slide,), 1, 1)
+    assert parse_step("NEXT_SLIDE?") == ((next_slide,), 0, 1)
+    assert parse_step("NEXT_SLIDE{2}") == ((next_slide,), 2, 2)
+    assert parse_step("PLAY_VIDEO | NEXT_SLIDE{1,3}") == ((play_video, next_slide), 1, 3)
+
+
+def test_empty_workflow_is_rejected():
+    with pytest.raises(ValueError):
+        CompiledWorkflow([])
+
+
+def test_optional_step():
+    workflow = CompiledWorkflow(["PRESENTATION_MODE_ON", "PLAY_VIDEO?", "NEXT_SLIDE"])
+    assert workflow.matches(["PRESENTATION_MODE_ON", "NEXT_SLIDE"])
+    assert workflow.matches(["PRESENTATION_MODE_ON", "PLAY_VIDEO", "NEXT_SLIDE"])
+    assert not workflow.matches(["PRESENTATION_MODE_ON", "PLAY_VIDEO", "PLAY_VIDEO", "NEXT_SLIDE"])
+    assert list(workflow) == ["PRESENTATION_MODE_ON", "NEXT_SLIDE"]
+    assert workflow.expected[workflow.start] == "PRESENTATION_MODE_ON"
+    after_start = workflow.step(workflow.start, GESTURE_IDS["PRESENTATION_MODE_ON"])
+    assert workflow.expected[after_start] in ("NEXT_SLIDE|PLAY_VIDEO", "PLAY_VIDEO|NEXT_SLIDE")
+
+
+def test_repeat_range():
+    workflow = CompiledWorkflow(["PRESENTATION_MODE_ON", "NEXT_SLIDE{1,3}", "PRESENTATION_MODE_OFF"])
+    for count in (1, 2, 3):
+        assert workflow.matches(["PRESENTATION_MODE_ON"] + ["NEXT_SLIDE"] * count + ["PRESENTATION_MODE_OFF"])
+    assert not workflow.matches(["PRESENTATION_MODE_ON", "PRESENTATION_MODE_OFF"])
+    assert not workflow.matches(["PRESENTATION_MODE_ON"] + ["NEXT_SLIDE"] * 4 + ["PRESENTATION_MODE_OFF"])
+    assert len(workflow) == 3
+
+
+def test_exact_repeat():
+    workflow = CompiledWorkflow(["QUESTION_BLOCK{2}", "NEXT_SLIDE"])
+    assert workflow.matches(["QUESTION_BLOCK", "QUESTION_BLOCK", "NEXT_SLIDE"])
+    assert not workflow.matches(["QUESTION_BLOCK", "NEXT_SLIDE"])
+    assert list(workflow) == ["QUESTION_BLOCK", "QUESTION_BLOCK", "NEXT_SLIDE"]
+
+
+def test_alternatives():
+    workflow = CompiledWorkflow(["PLAY_VIDEO|NEXT_SLIDE", "PRESENTATION_MODE_OFF"])
+    assert workflow.matches(["PLAY_VIDEO", "PRESENTATION_MODE_OFF"])
+    assert workflow.matches(["NEXT_SLIDE", "PRESENTATION_MODE_OFF"])
+    assert not workflow.matches(["STOP_VIDEO", "PRESENTATION_MODE_OFF"])
+    assert workflow.step(workflow.start, GESTURE_IDS["STOP_VIDEO"]) == DEAD
+    assert list(workflow) == ["PLAY_VIDEO", "PRESENTATION_MODE_OFF"]
+
+
+@pytest.mark.parametrize("definition", [["NEXT_SLIDE", "PLAY_VIDEO?"], ["NEXT_SLIDE{1,2}"],
+                                        ["NEXT_SLIDE?", "NEXT_SLIDE"]])
+def test_workflows_that_continue_after_completion_are_rejected(definition):
+    with pytest.raises(ValueError):
+        CompiledWorkflow(definition)
+
+
+def test_workflow_set_strict_and_lenient():
+    workflows = [["NEXT_SLIDE", "PLAY_VIDEO"], ["NEXT_SLIDE", "STOP_VIDEO"]]
+    gestures = ["NEXT_SLIDE", "STOP_VIDEO", "PLAY_VIDEO"]
+
+    strict = WorkflowSet(workflows)
+    for gesture in gestures:
+        strict.feed(GESTURE_IDS[gesture])
+    assert strict.completed() == ()
+
+    lenient = WorkflowSet(workflows, strict=False)
+    completed = set()
+    for gesture in gestures:
+        completed.update(lenient.feed(GESTURE_IDS[gesture]))
+    assert completed == {0, 1}
+
+
+def test_shipped_workflows_compile():
+    for gesture_type in ("specific", "counting", "working_specific", "working_counting"):
+        workflows = load_workflows(gesture_type)
+        assert len(workflows) == 3
+        for workflow in workflows:
+            assert workflow.matches(workflow.steps)
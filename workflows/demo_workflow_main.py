@@ -1,45 +1,58 @@
+import argparse
 import csv
 import uuid
-import openpyxl
 import os
-import psutil
-import time
-import win32com.client
-import pyautogui
 import random
+import sqlite3
+import sys
 
-import demo_workflow_specific as specific_flow
-import demo_workflows_counting as counting_flow
+# Make the shared gesture_engine package importable when run as a script
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gesture_engine.backends import get_backend
+from gesture_engine.startup import BackgroundTask, StartupTimer
+from gesture_engine.options import add_session_arguments, session_options
+from gesture_engine.results import ResultsStore
+from gesture_engine.store import RunErrors, SessionStore
+
+# OpenCV, MediaPipe, the workflow modules and the PowerPoint automation are
+# imported where they are first needed; these load on the warm-up thread
+WARM_UP_IMPORTS = ("numpy", "cv2", "mediapipe", "gesture_engine.engine",
+                   "demo_workflow_specific", "demo_workflows_counting")
 
-EXCEL_FILE = "logs/user_performance.xlsx"
 ERROR_LOG_FILE = "logs/error_log.csv"
+PPTX_DIR = "D:/Ostalo/faks/4. semestar/HCI/computer_vision_pptx_controller/pptx"
 
-def close_pptx():
-    """
-    Close the PowerPoint application by terminating its process.
-    """
-    ppt_app = win32com.client.Dispatch("PowerPoint.Application")
-    ppt_app.Quit()
+def pptx_path(file_number):
+    return f"{PPTX_DIR}/WORKFLOW_{file_number}.pptx"
 
-def save_to_excel(user_uuid, results):
+def warm_up_session(options, timer):
     """
-    Save the results to the Excel file.
+    Import the gesture engine, open the camera and load the hand model, timing each step.
     """
-    wb = openpyxl.load_workbook(EXCEL_FILE)
-    ws = wb.active
+    for name in WARM_UP_IMPORTS:
+        timer.timed_import(name)
+    from gesture_engine.session import GestureSession
+
+    start = timer.now()
+    session = GestureSession(warm_up=True, startup_timer=timer, **options).open()
+    timer.record("open camera and hand model", start)
+    return session
 
-    # Find the next available row
-    row = ws.max_row + 1
+def main():
+    timer = StartupTimer()
+    parser = argparse.ArgumentParser(description="Run all gesture workflows for one participant.")
+    add_session_arguments(parser)
+    args = parser.parse_args()
 
-    # Write the results to the Excel file
-    ws.cell(row=row, column=1, value=str(user_uuid))
-    for i, (elapsed_time, error_count) in enumerate(results):
-        ws.cell(row=row, column=2 + i * 2, value=elapsed_time)
-        ws.cell(row=row, column=3 + i * 2, value=error_count)
+    # Both gesture types start with the first deck, so PowerPoint can load it during warm-up too
+    options = session_options(args)
+    options["backend"] = backend = get_backend(args.backend)
+    backend.preload_deck(pptx_path(1))
 
-    wb.save(EXCEL_FILE)
+    # Load MediaPipe and open the camera in the background while the logs are prepared
+    warm_up = BackgroundTask(warm_up_session, options, timer, name="WarmUp").start()
 
-def main():
     random_uuid = uuid.uuid4()
     specific_results = []
     counting_results = []
@@ -49,102 +62,78 @@ def main():
         writer = csv.writer(file)
         writer.writerow(["Timestamp", "Gesture type", "Flow number", "Step", "Detected Gesture", "Expected Gesture"])
 
+    # Keep every run and error event across participants
+    start = timer.now()
+    store = SessionStore()
+    timer.record("open session store", start)
+
+    # The camera and hand model are shared by all workflows
+    start = timer.now()
+    session = warm_up.result()
+    timer.record("wait for warm-up", start)
+
+    try:
+        run_all_workflows(session, specific_results, counting_results, store, random_uuid)
+    finally:
+        session.close()
+        store.close()
+        timer.report()
+
+    # Append results to the store; export_performance.py builds the Excel workbook from it
+    ResultsStore().append(random_uuid, specific_results + counting_results, startup=timer.summary(),
+                          launches=backend.launches)
+
+def process_and_store(flow, gesture_type, workflow, flow_number, session, store, user_uuid):
+    """
+    Run one workflow and record it, with its error events, in the session store.
+
+    A failing store is only reported, so the participant's result is still returned.
+    """
+    from gesture_engine.engine import log_error
+
+    errors = RunErrors(forward=log_error)
+    elapsed_time, error_count = flow.process_workflow(workflow, flow_number, session, errors)
+    if store is not None:
+        try:
+            store.add_run(user_uuid, gesture_type, flow_number, workflow, elapsed_time, errors.events)
+        except sqlite3.Error as e:
+            print(f"Error storing workflow {flow_number} in the session store: {e}")
+    return elapsed_time, error_count
+
+def run_flows(flow, gesture_type, results, session, store, user_uuid):
+    """
+    Run every workflow of one gesture type, opening its deck first.
+    """
+    for i, workflow in enumerate(flow.WORKFLOWS):
+        print(f"Processing workflow {i + 1}/{len(flow.WORKFLOWS)}: {' -> '.join(workflow)}")
+
+        # Open the PowerPoint file and wait until it takes key presses
+        session.backend.open_deck(pptx_path(i + 1))
+
+        try:
+            # Process the workflow
+            elapsed_time, error_count = process_and_store(flow, gesture_type, workflow, i + 1, session,
+                                                          store, user_uuid)
+            results.append((elapsed_time, error_count))
+        except Exception as e:
+            print(f"Error processing workflow {i + 1}: {e}")
+        finally:
+            # Ensure PowerPoint is fully closed before proceeding to the next iteration
+            session.backend.close_deck()
+
+def run_all_workflows(session, specific_results, counting_results, store=None, user_uuid=None):
+    """
+    Run every specific and counting workflow in random order using one shared session.
+    """
+    import demo_workflow_specific as specific_flow
+    import demo_workflows_counting as counting_flow
+
+    flows = [(specific_flow, "Specific", specific_results), (counting_flow, "Counting", counting_results)]
     # Randomize the order of the loops
     if random.choice([True, False]):
-        # Process workflows from `specific_flow.WORKFLOWS` first
-        for i, workflow in enumerate(specific_flow.WORKFLOWS):
-            file_number = i + 1
-            pptx_path = f"D:/Ostalo/faks/4. semestar/HCI/computer_vision_pptx_controller/pptx/WORKFLOW_{file_number}.pptx"
-            print(f"Processing workflow {i + 1}/{len(specific_flow.WORKFLOWS)}: {' -> '.join(workflow)}")
-
-            # Open the PowerPoint file
-            os.startfile(pptx_path)
-
-            time.sleep(5)
-
-            pyautogui.click()
-
-            try:
-                # Process the workflow
-                elapsed_time, error_count = specific_flow.process_workflow(workflow, i + 1)
-                specific_results.append((elapsed_time, error_count))
-            except Exception as e:
-                print(f"Error processing workflow {i + 1}: {e}")
-            finally:
-                # Ensure PowerPoint is fully closed before proceeding to the next iteration
-                close_pptx()
-
-        # Process workflows from `counting_flow.WORKFLOWS`
-        for i, workflow in enumerate(counting_flow.WORKFLOWS):
-            file_number = i + 1
-            pptx_path = f"D:/Ostalo/faks/4. semestar/HCI/computer_vision_pptx_controller/pptx/WORKFLOW_{file_number}.pptx"
-            print(f"Processing workflow {i + 1}/{len(counting_flow.WORKFLOWS)}: {' -> '.join(workflow)}")
-
-            # Open the PowerPoint file
-            os.startfile(pptx_path)
-
-            time.sleep(5)
-
-            pyautogui.click()
-
-            try:
-                # Process the workflow
-                elapsed_time, error_count = counting_flow.process_workflow(workflow, i + 1)
-                counting_results.append((elapsed_time, error_count))
-            except Exception as e:
-                print(f"Error processing workflow {i + 1}: {e}")
-            finally:
-                # Ensure PowerPoint is fully closed before proceeding to the next iteration
-                close_pptx()
-    else:
-        # Process workflows from `counting_flow.WORKFLOWS` first
-        for i, workflow in enumerate(counting_flow.WORKFLOWS):
-            file_number = i + 1
-            pptx_path = f"D:/Ostalo/faks/4. semestar/HCI/computer_vision_pptx_controller/pptx/WORKFLOW_{file_number}.pptx"
-            print(f"Processing workflow {i + 1}/{len(counting_flow.WORKFLOWS)}: {' -> '.join(workflow)}")
-
-            # Open the PowerPoint file
-            os.startfile(pptx_path)
-
-            time.sleep(5)
-
-            pyautogui.click()
-
-            try:
-                # Process the workflow
-                elapsed_time, error_count = counting_flow.process_workflow(workflow, i + 1)
-                counting_results.append((elapsed_time, error_count))
-            except Exception as e:
-                print(f"Error processing workflow {i + 1}: {e}")
-            finally:
-                # Ensure PowerPoint is fully closed before proceeding to the next iteration
-                close_pptx()
-
-        # Process workflows from `specific_flow.WORKFLOWS`
-        for i, workflow in enumerate(specific_flow.WORKFLOWS):
-            file_number = i + 1
-            pptx_path = f"D:/Ostalo/faks/4. semestar/HCI/computer_vision_pptx_controller/pptx/WORKFLOW_{file_number}.pptx"
-            print(f"Processing workflow {i + 1}/{len(specific_flow.WORKFLOWS)}: {' -> '.join(workflow)}")
-
-            # Open the PowerPoint file
-            os.startfile(pptx_path)
-
-            time.sleep(5)
-
-            pyautogui.click()
-
-            try:
-                # Process the workflow
-                elapsed_time, error_count = specific_flow.process_workflow(workflow, i + 1)
-                specific_results.append((elapsed_time, error_count))
-            except Exception as e:
-                print(f"Error processing workflow {i + 1}: {e}")
-            finally:
-                # Ensure PowerPoint is fully closed before proceeding to the next iteration
-                close_pptx()
-
-    # Save results to Excel
-    save_to_excel(random_uuid, specific_results + counting_results)
+        flows.reverse()
+    for flow, gesture_type, results in flows:
+        run_flows(flow, gesture_type, results, session, store, user_uuid)
 
 
 if __name__ == "__main__":
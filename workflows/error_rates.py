@@ -0,0 +1,43 @@
+import argparse
+import json
+import os
+import sys
+
+# Make the shared gesture_engine package importable when run as a script
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gesture_engine.store import SESSIONS_DB, SessionStore
+
+def print_table(rows):
+    """
+    Print error rates per gesture pair as an aligned table.
+    """
+    print(f"{'type':<10}{'expected':<24}{'detected':<24}{'errors':>8}{'steps':>8}{'rate':>8}{'users':>7}")
+    for row in rows:
+        rate = f"{row['error_rate']:.1%}" if row["error_rate"] is not None else "-"
+        print(f"{row['gesture_type']:<10}{row['expected']:<24}{row['detected']:<24}"
+              f"{row['errors']:>8}{row['steps']:>8}{rate:>8}{row['participants']:>7}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Error rates per expected/detected gesture pair across all sessions.")
+    parser.add_argument("--db", default=SESSIONS_DB, help=f"session store to query (default: {SESSIONS_DB})")
+    parser.add_argument("--gesture-type", choices=("Specific", "Counting"), help="only runs of this gesture type")
+    parser.add_argument("--top", type=int, metavar="N", help="only the N most frequent pairs")
+    parser.add_argument("--json", action="store_true", help="print the rows as JSON")
+    args = parser.parse_args()
+
+    if not os.path.exists(args.db):
+        sys.exit(f"No session store at {args.db}, run workflows/demo_workflow_main.py first.")
+
+    with SessionStore(args.db) as store:
+        rows = store.error_rates(args.gesture_type)[:args.top]
+        if args.json:
+            print(json.dumps(rows, indent=2))
+            return
+        totals = store.totals()
+        print(f"{totals['participants']} participants, {totals['workflow_runs']} workflow runs, "
+              f"{totals['error_events']} errors")
+        print_table(rows)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,28 @@
+import argparse
+import os
+import sys
+
+# Make the shared gesture_engine package importable when run as a script
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gesture_engine.results import RESULTS_FILE, ResultsStore, export_xlsx, import_xlsx
+
+EXCEL_FILE = "logs/user_performance.xlsx"
+
+def main():
+    parser = argparse.ArgumentParser(description="Export the participant results store to the analysts' Excel workbook.")
+    parser.add_argument("--store", default=RESULTS_FILE, help=f"results store to read (default: {RESULTS_FILE})")
+    parser.add_argument("--output", default=EXCEL_FILE, help=f"workbook to write (default: {EXCEL_FILE})")
+    parser.add_argument("--import-xlsx", metavar="PATH",
+                        help="first add the participants of an older workbook to the store")
+    args = parser.parse_args()
+
+    store = ResultsStore(args.store)
+    if args.import_xlsx:
+        print(f"Imported {import_xlsx(args.import_xlsx, store)} participants from {args.import_xlsx}")
+
+    rows = export_xlsx(store.records(), args.output)
+    print(f"Exported {rows} participants to {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+import argparse
+import os
+import sys
+
+# Make the shared gesture_engine package importable when run as a script
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gesture_engine.options import add_session_arguments, session_options
+from gesture_engine.workflows import WORKFLOWS_FILE
+
+def main():
+    parser = argparse.ArgumentParser(description="Check which workflows one gesture stream performs, all at once.")
+    parser.add_argument("--gesture-type", choices=("specific", "counting"), default="specific",
+                        help="workflows and classifier to use")
+    parser.add_argument("--workflows", default=WORKFLOWS_FILE, metavar="PATH", help="workflow definitions file")
+    parser.add_argument("--lenient", action="store_true",
+                        help="skip wrong gestures like workflow runs do instead of failing a workflow on them")
+    add_session_arguments(parser)
+    args = parser.parse_args()
+
+    from gesture_engine.classifiers import get_classifier
+    from gesture_engine.engine import detect_hands
+    from gesture_engine.gestures import GESTURE_IDS
+    from gesture_engine.session import GestureSession
+    from gesture_engine.workflows import WorkflowSet, load_workflows
+
+    workflows = load_workflows(args.gesture_type, args.workflows)
+    workflow_set = WorkflowSet(workflows, strict=not args.lenient)
+    classifier = get_classifier(args.gesture_type)
+    options = dict(session_options(args), headless=True, dispatch_actions=False)
+
+    completed = set()
+    with GestureSession(**options) as session:
+        cap = session.cap
+        debouncer = session.debouncer(classifier)
+        while not session.stop_requested():
+            success, frame, _ = cap.read_with_timestamp()
+            if not success:
+                if not cap.isOpened():
+                    break
+                continue
+
+            results = detect_hands(session, session.preprocessor.mirror(frame))
+            if results is None:
+                continue
+            gesture = "UNKNOWN"
+            for hand_landmarks in results.multi_hand_landmarks or ():
+                gesture = classifier.classify(hand_landmarks)
+            fired = debouncer.update(gesture)
+            if fired is None:
+                continue
+
+            for index in workflow_set.feed(GESTURE_IDS[fired]):
+                if index not in completed:
+                    completed.add(index)
+                    print(f"Workflow {index + 1} completed after {workflow_set.gestures} gestures.")
+
+    for index, workflow in enumerate(workflows):
+        status = "completed" if index in completed else "not completed"
+        print(f"Workflow {index + 1} {status}: {' -> '.join(workflow.definition)}")
+    print(f"Matcher stats: {workflow_set.stats()}")
+
+if __name__ == "__main__":
+    main()